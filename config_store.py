@@ -1,26 +1,66 @@
 import os
 import json
+import threading
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    _orjson = None
 
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".rodop_run_config.json")
 
+# in-memory copy of CONFIG_FILE, re-read only when the file's mtime changes
+_CACHE: dict | None = None
+_CACHE_MTIME: float = 0.0
+_LOCK = threading.Lock()
+
 
 def _load_config() -> dict:
-    if os.path.isfile(CONFIG_FILE):
+    global _CACHE, _CACHE_MTIME
+    with _LOCK:
+        try:
+            mtime = os.path.getmtime(CONFIG_FILE)
+        except OSError:
+            _CACHE, _CACHE_MTIME = {}, 0.0
+            return {}
+
+        # hand out copies, so a caller editing the result cannot touch the cache
+        if _CACHE is not None and mtime == _CACHE_MTIME:
+            return dict(_CACHE)
+
+        data = {}
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                raw = f.read()
+            data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
         except Exception:
             pass
-    return {}
+        _CACHE = data
+        _CACHE_MTIME = mtime
+        return dict(_CACHE)
 
 
 def _save_config(data: dict):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    global _CACHE, _CACHE_MTIME
+    if _orjson is not None:
+        data_bytes = _orjson.dumps(data)
+    else:
+        data_bytes = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    tmp = CONFIG_FILE + ".tmp"
+    with _LOCK:
+        # write to a temp file and rename, so a crash never leaves a truncated config
+        with open(tmp, "wb") as f:
+            f.write(data_bytes)
+        os.replace(tmp, CONFIG_FILE)
+        # only a config that actually reached the disk becomes the cache
+        _CACHE = dict(data)
+        _CACHE_MTIME = os.path.getmtime(CONFIG_FILE)
 
 
 def save_executable(path: str):
     cfg = _load_config()
+    if cfg.get("rodeo_executable") == path:
+        return
     cfg["rodeo_executable"] = path
     _save_config(cfg)
 
@@ -1,12 +1,57 @@
 # constraint_definition.py
 from __future__ import annotations
 from typing import Optional
-from PyQt6.QtCore import pyqtSignal
+from functools import lru_cache
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QTimer
 from string_field import StringField
-import re
 from xml.etree import ElementTree as ET
 
 
+_OPS = (">=", "<=", "==", "!=", ">", "<")
+_OPS_2 = frozenset(_OPS[:4])
+
+
+def _is_number(s: str) -> bool:
+    """
+    True if `s` is exactly '-'?, digits, optional '.digits'. float() alone is
+    too permissive here (it also takes '1e3', 'inf', '1_0', '+1').
+    """
+    n = len(s)
+    i = 1 if s[:1] == "-" else 0
+    start = i
+    while i < n and s[i].isdecimal():
+        i += 1
+    if i == start:
+        return False
+    if i < n and s[i] == ".":
+        i += 1
+        start = i
+        while i < n and s[i].isdecimal():
+            i += 1
+        if i == start:
+            return False
+    return i == n
+
+
+def _parse_definition(s: str) -> tuple[str, float, str] | None:
+    """
+    Parse a canonicalised definition (stripped, ',' replaced by '.') into
+    (operator, value, value_text), or None if it is not valid.
+    """
+    if not s.startswith(_OPS):
+        return None
+    op = s[:2] if s[:2] in _OPS_2 else s[0]
+    tail = s[len(op):].lstrip()
+    if not _is_number(tail):
+        return None
+    return op, float(tail), tail
+
+
+@lru_cache(maxsize=256)
+def _is_valid_definition_cached(s: str) -> bool:
+    return _parse_definition(s) is not None
+
+
 class ConstraintDefinition(StringField):
     """
     A StringField specialized for constraint definitions.
@@ -43,8 +88,29 @@ class ConstraintDefinition(StringField):
         # Identify the line edit for optional QSS targeting
         self._edit.setObjectName("constraintDefinitionEdit")
 
+        # last validity state applied to the QLineEdit (None = never validated)
+        self._last_valid: Optional[bool] = None
+
+        # parsed form of the text, keyed by the canonicalised text it came from
+        self._parsed: tuple[str, float, str] | None = None
+        self._parsed_key: Optional[str] = None
+
+        # Validate ~50 ms after the last keystroke instead of on every one
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(50)
+        self._debounce.timeout.connect(self._on_debounce_timeout)
+
         # Connect validator to text changes and run once
-        self.textChanged.connect(self._validate_definition)
+        self.textChanged.connect(self._on_text_edited)
+        self._validate_definition(self.text)
+
+    @pyqtSlot()
+    def _on_text_edited(self) -> None:
+        self._debounce.start()
+
+    @pyqtSlot()
+    def _on_debounce_timeout(self) -> None:
         self._validate_definition(self.text)
 
     # -------- XML helpers (override to expose operator/value if valid) --------
@@ -52,16 +118,13 @@ class ConstraintDefinition(StringField):
         """
         Return <definition> with operator/value if valid, otherwise raw text.
         """
-        text = self.text.strip()
+        text, parsed = self._canon()
         el = ET.Element(tag or "definition")
 
-        if self.is_valid_definition(text):
-            s = text.replace(",", ".")
-            pattern = r'^(>=|<=|>|<|==|!=)\s*(-?\d+(\.\d+)?)$'
-            m = re.match(pattern, s)
-            if m:
-                el.set("operator", m.group(1))
-                el.set("value", m.group(2))
+        if parsed is not None:
+            op, _value, value_text = parsed
+            el.set("operator", op)
+            el.set("value", value_text)
         else:
             el.text = text
 
@@ -86,22 +149,42 @@ class ConstraintDefinition(StringField):
     def is_valid_definition(s: str) -> bool:
         if not s:
             return False
-        s = s.strip().replace(",", ".")
-        pattern = r'^(>=|<=|>|<|==|!=)\s*(-?\d+(\.\d+)?)$'
-        return bool(re.match(pattern, s))
+        return _is_valid_definition_cached(s.strip().replace(",", "."))
+
+    @property
+    def parsed(self) -> tuple[str, float, str] | None:
+        """
+        (operator, value, value_text) of the current text, or None if invalid.
+        """
+        return self._canon()[1]
+
+    def _canon(self) -> tuple[str, tuple[str, float, str] | None]:
+        """
+        Return the stripped text and its parsed form (',' read as '.').
+        """
+        text = self.text.strip()
+        return text, self._parse_cached(text.replace(",", "."))
+
+    def _parse_cached(self, key: str) -> tuple[str, float, str] | None:
+        if key != self._parsed_key:
+            self._parsed = _parse_definition(key)
+            self._parsed_key = key
+        return self._parsed
 
     def _validate_definition(self, s: str) -> None:
         s = (s or "").strip()
         if not s:
-            self._edit.setProperty("isValid", False)
+            ok = False
             self._edit.setToolTip("")
-            self._refresh_style()
-            self.validationChanged.emit(False)
-            return
+        else:
+            ok = self._parse_cached(s.replace(",", ".")) is not None
+            self._edit.setToolTip("Valid constraint definition" if ok else "Invalid definition. Use e.g. '> 9.0' or '>= -12,5'")
 
-        ok = self.is_valid_definition(s)
+        # repolish + notify only when the state actually flips
+        if ok == self._last_valid:
+            return
+        self._last_valid = ok
         self._edit.setProperty("isValid", ok)
-        self._edit.setToolTip("Valid constraint definition" if ok else "Invalid definition. Use e.g. '> 9.0' or '>= -12,5'")
         self._refresh_style()
         self.validationChanged.emit(ok)
 
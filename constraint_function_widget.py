@@ -1,20 +1,73 @@
 # constraint_function_widget.py
 from __future__ import annotations
 from typing import Optional, Dict
+from contextlib import contextmanager
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QApplication,
-    QSizePolicy, QGroupBox, QPushButton, QLineEdit
+    QSizePolicy, QGroupBox, QPushButton
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QTimer
 from xml.etree import ElementTree as ET
 import sys, os, re
+import string
 
 from string_field import StringField
 from string_options_field import StringOptionsField
 from file_path_field import FilePathField
 from directory_path_field import DirectoryPathField
 from remote_server_widget import RemoteServerWidget
+from edit_style import INVALID_QSS, VALID_QSS, INACTIVE_QSS, set_edit_style
+
+
+_strip = str.strip
+# basename of the design-variables / output file (fullmatch, so no anchors)
+_FILENAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9 _.-]{0,198}[A-Za-z0-9]")
+# deletes every allowed name character; anything left over makes the name invalid
+_NAME_KILL_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_")
+
+# execution locations and the root XML tag, shared by every method that uses them
+_LOCAL = "local"
+_REMOTE = "remote"
+_LOCATIONS = (_LOCAL, _REMOTE)
+_XML_TAG = "constraint_function"
+
+# cleared state of the four file_fields entries (set_paths only iterates it)
+_DEFAULT_PATHS = ("", "", "", "")
+
+
+def _validate_fast(s: str) -> bool:
+    """
+    Hand-written validator for a stripped constraint definition:
+    '<' or '>', optional whitespace, optional sign, digits, optional '.digits'.
+    """
+    n = len(s)
+    if not n or s[0] not in "<>":
+        return False
+    i = 1
+    while i < n and s[i].isspace():
+        i += 1
+    if i < n and s[i] in "+-":
+        i += 1
+    start = i
+    while i < n and s[i].isdecimal():
+        i += 1
+    if i == start:
+        return False
+    if i < n and s[i] == ".":
+        i += 1
+        start = i
+        while i < n and s[i].isdecimal():
+            i += 1
+        if i == start:
+            return False
+    return i == n
+
+
+def _text_element(tag: str, text: str) -> ET.Element:
+    el = ET.Element(tag)
+    el.text = text
+    return el
 
 
 class ConstraintFunction(QWidget):
@@ -24,6 +77,40 @@ class ConstraintFunction(QWidget):
 
     changed = pyqtSignal()
 
+    # labels of the four file_fields entries
+    _FILE_LABELS = (
+        "Executable file name",
+        "Training data file",
+        "Design variables file",
+        "Output file",
+    )
+
+    # XML tags of the four file_fields entries, in field order
+    _FILE_TAGS = (
+        "executable_filename",
+        "training_data_filename",
+        "design_vector_filename",
+        "output_filename",
+    )
+
+    # name filters of the four file_fields entries (FilePathField only reads them)
+    _FILE_FILTERS = (
+        ("Python (*.py)", "Executables (*.sh *.bin *.exe)", "All files (*)"),
+        ("Data (*.csv *.dat *.txt)", "All files (*)"),
+        ("Data (*.csv *.dat *.txt *.xml)", "All files (*)"),
+        ("Data (*.dat *.txt *.csv)", "All files (*)"),
+    )
+
+    # default working directory, looked up on first construction and then shared
+    # (not at import time: main.py changes directory after importing the widgets)
+    _default_workdir_cache: Optional[str] = None
+
+    @classmethod
+    def refresh_default_workdir(cls) -> str:
+        """Re-read the current directory used as the default working directory."""
+        cls._default_workdir_cache = os.getcwd()
+        return cls._default_workdir_cache
+
     def __init__(
         self,
         *,
@@ -38,18 +125,38 @@ class ConstraintFunction(QWidget):
         # Defaults
         # --------------------------------------------------
         self._default_name = "ConstraintFunction"
-        self._default_execution_location = "local"
-        self._default_paths = ["", "", "", ""]
-        self._default_workdir = os.getcwd()
-
-        # name validation state + style
-        self._name_valid = True
-        self._invalid_name_style = """
-        QLineEdit {
-            border: 2px solid red;
-            border-radius: 3px;
-        }
-        """
+        self._default_execution_location = _LOCAL
+        self._default_paths = _DEFAULT_PATHS
+        self._default_workdir = (
+            ConstraintFunction._default_workdir_cache
+            or ConstraintFunction.refresh_default_workdir()
+        )
+
+        # last alias-empty/non-empty state applied to the file rows (None = never)
+        self._alias_active_state: Optional[bool] = None
+
+        # stripped text last checked by _validate_filename_field, per field index
+        self._last_filename: dict[int, str] = {}
+        # ... and by _on_training_file_changed
+        self._last_training: Optional[str] = None
+
+        # parsed definition, keyed by the stripped text it came from
+        self._definition_parsed: tuple[str, float, str] | None = None
+        self._definition_key: Optional[str] = None
+
+        # live validation runs 200 ms after the last keystroke, or as soon
+        # as editing finishes; _pending_validation names the fields to check
+        self._pending_validation: set[str] = set()
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(200)
+        self._validate_timer.timeout.connect(self._flush_validation)
+
+        # bursts of edits collapse into one `changed` on the next event-loop pass
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.changed.emit)
 
         # --------------------------------------------------
         # Group box
@@ -73,7 +180,9 @@ class ConstraintFunction(QWidget):
             field_width=field_width,
             parent=self.group_box,
         )
-        self.name_field.textChanged.connect(self._on_name_changed)
+        # one slot per keystroke: queue the (debounced) check and schedule `changed`
+        self.name_field.textChanged.connect(self._on_name_edited)
+        self.name_field.editingFinished.connect(self._flush_validation)
 
         # NEW: Alias field
         self.alias_field = StringField(
@@ -89,7 +198,7 @@ class ConstraintFunction(QWidget):
         self.execution_location_field = StringOptionsField(
             "Execution location",
             value=self._default_execution_location,
-            options=["local", "remote"],
+            options=_LOCATIONS,
             label_width=label_width,
             field_width=field_width,
             parent=self.group_box,
@@ -104,42 +213,33 @@ class ConstraintFunction(QWidget):
         )
 
         self.file_fields = FilePathField(
-            ["Executable file name",
-             "Training data file",
-             "Design variables file",
-             "Output file"],
-            path=list(self._default_paths),
+            self._FILE_LABELS,
+            path=self._default_paths,
             select_mode="open_file",
             dialog_title="Select File",
-            filters=[
-                ["Python (*.py)", "Executables (*.sh *.bin *.exe)", "All files (*)"],
-                ["Data (*.csv *.dat *.txt)", "All files (*)"],
-                ["Data (*.csv *.dat *.txt *.xml)", "All files (*)"],
-                ["Data (*.dat *.txt *.csv)", "All files (*)"],
-            ],
+            filters=self._FILE_FILTERS,
             label_width=label_width,
             field_width=field_width,
             parent=self.group_box,
         )
 
+        # widgets of the four file rows, resolved once instead of per keystroke
+        # (0 executable, 1 training data, 2 design variables, 3 output)
+        fields = self.file_fields._fields
+        _lbl, self._exe_edit, self._exe_btn = fields[0]
+        _lbl, self._tr_edit, _btn = fields[1]
+        _lbl, self._design_edit, self._design_btn = fields[2]
+        _lbl, self._output_edit, _btn = fields[3]
+
         # --- NEW: training-data field hint + validation ---
-        if hasattr(self.file_fields, "_fields") and len(self.file_fields._fields) >= 2:
-            # index 1 == "Training data file"
-            _lbl_tr, edit_tr, _btn_tr = self.file_fields._fields[1]
-            edit_tr.setPlaceholderText("Specify a CSV file (*.csv)")
-            # connect change signal once; we re-validate on any change
-            edit_tr.textChanged.connect(self._on_training_file_changed)
+        self._tr_edit.setPlaceholderText("Specify a CSV file (*.csv)")
+        # connect change signal once; we re-validate on any change
+        self._tr_edit.textChanged.connect(self._on_training_edited)
+        self._tr_edit.editingFinished.connect(self._flush_validation)
 
         # NEW: validate filename for Design variables file (index 2) and Output file (index 3)
-        if hasattr(self.file_fields, "_fields") and self.file_fields._fields:
-            if len(self.file_fields._fields) > 2:
-                _lbl, edit, _btn = self.file_fields._fields[2]
-                if isinstance(edit, QLineEdit):
-                    edit.textChanged.connect(lambda _t: self._validate_filename_field(2))
-            if len(self.file_fields._fields) > 3:
-                _lbl, edit, _btn = self.file_fields._fields[3]
-                if isinstance(edit, QLineEdit):
-                    edit.textChanged.connect(lambda _t: self._validate_filename_field(3))
+        self._design_edit.textChanged.connect(self._validate_design_filename)
+        self._output_edit.textChanged.connect(self._validate_output_filename)
 
         # NEW: apply initial state
         self._sync_executable_with_alias()
@@ -155,17 +255,15 @@ class ConstraintFunction(QWidget):
             parent=self.group_box,
         )
 
-        if hasattr(self.working_dir_field, "layout"):
-            self.working_dir_field.layout().setAlignment(
-                Qt.AlignmentFlag.AlignLeft
-            )
+        if (wd_layout := self.working_dir_field.layout()) is not None:
+            wd_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        self.remote_server_widget = RemoteServerWidget(
-            label_width=label_width,
-            field_width=field_width,
-            parent=self.group_box,
-        )
-        self.remote_server_widget.setVisible(False)
+        # RemoteServerWidget is only built once "remote" is first selected;
+        # _is_remote mirrors execution_location and is kept by its change handler
+        self.remote_server_widget: Optional[RemoteServerWidget] = None
+        self._is_remote = self._default_execution_location == _REMOTE
+        self._label_width = label_width
+        self._field_width = field_width
 
         self.clear_button = QPushButton("Clear", self.group_box)
         self.clear_button.clicked.connect(self.clear_fields)
@@ -186,7 +284,9 @@ class ConstraintFunction(QWidget):
         inner_layout.addWidget(self.definition_field)
         inner_layout.addWidget(self.file_fields)
         inner_layout.addWidget(self.working_dir_field)
-        inner_layout.addWidget(self.remote_server_widget)
+        # slot where the remote server widget is inserted on demand
+        self._inner_layout = inner_layout
+        self._remote_index = inner_layout.count()
 
         btn_row = QHBoxLayout()
         btn_row.addStretch(1)
@@ -208,39 +308,101 @@ class ConstraintFunction(QWidget):
         # --------------------------------------------------
         # Signals
         # --------------------------------------------------
-        self.name_field.textChanged.connect(self.changed.emit)
         self.execution_location_field.valueChanged.connect(
             self._on_execution_location_changed
         )
-        self.definition_field.textChanged.connect(self._on_definition_changed)
-
-        if hasattr(self.file_fields, "pathChanged"):
-            self.file_fields.pathChanged.connect(lambda _: self.changed.emit())
+        # like the name: queue the (debounced) check and schedule `changed` at once
+        self.definition_field.textChanged.connect(self._on_definition_edited)
+        self.definition_field.editingFinished.connect(self._flush_validation)
 
-        self.working_dir_field.pathChanged.connect(lambda _: self.changed.emit())
-        self.remote_server_widget.changed.connect(self.changed.emit)
+        self.file_fields.pathChanged.connect(self._schedule_changed)
+        self.working_dir_field.pathChanged.connect(self._schedule_changed)
 
         # initial validation
         self._on_definition_changed(self.definition_field.text)
 
+        # construction is not an edit: run anything still queued now and drop
+        # the `changed` it scheduled
+        self._flush_validation()
+        self._changed_timer.stop()
+
+    @pyqtSlot()
+    def _schedule_changed(self) -> None:
+        """
+        Decorated as a no-argument slot so text/path signals can connect to it
+        directly; Qt drops their payload instead of going through a wrapper.
+        Nothing is scheduled while `changed` has no receivers yet.
+        """
+        if not self.receivers(self.changed):
+            return
+        if not self._changed_timer.isActive():
+            self._changed_timer.start()
+
     # ==================================================
     # Validation
     # ==================================================
 
-    def _is_valid_definition(self, text: str) -> bool:
-        text = text.strip()
-        if not text:
-            return False
-        pattern = r'^[<>]\s*[+-]?\d+(\.\d+)?$'
-        return re.match(pattern, text) is not None
+    @pyqtSlot()
+    def _on_name_edited(self) -> None:
+        self._queue_validation("name")
+        self._schedule_changed()
+
+    @pyqtSlot()
+    def _on_definition_edited(self) -> None:
+        self._queue_validation("definition")
+        self._schedule_changed()
+
+    @pyqtSlot()
+    def _on_training_edited(self) -> None:
+        # `changed` comes from file_fields.pathChanged
+        self._queue_validation("training")
+
+    def _queue_validation(self, field: str) -> None:
+        self._pending_validation.add(field)
+        self._validate_timer.start()
+
+    def _flush_validation(self) -> None:
+        """Run the validators queued by _queue_validation, once each."""
+        self._validate_timer.stop()
+        pending, self._pending_validation = self._pending_validation, set()
+        if "name" in pending:
+            self._on_name_changed(self.name_field.text)
+        if "definition" in pending:
+            self._on_definition_changed(self.definition_field.text)
+        if "training" in pending:
+            self._on_training_file_changed(self.file_fields.paths[1])
+
+    @property
+    def parsed_definition(self) -> tuple[str, float, str] | None:
+        """
+        (operator, value, value_text) of the current definition, or None if invalid.
+        """
+        return self._parse_definition_cached(self.definition_field.text.strip())
+
+    def _parse_definition_cached(self, key: str) -> tuple[str, float, str] | None:
+        """
+        Validate and split a stripped definition in one scan; the live
+        validator and to_xml share the result for the same text.
+        """
+        if key != self._definition_key:
+            if _validate_fast(key):
+                val = key[1:].lstrip()
+                self._definition_parsed = (key[0], float(val), val)
+            else:
+                self._definition_parsed = None
+            self._definition_key = key
+        return self._definition_parsed
 
     def _on_definition_changed(self, text: str) -> None:
-        valid = self._is_valid_definition(text)
-        self.definition_field.set_valid(
-            valid,
-            tooltip="Expected format: > 10.0 or < -3"
-        )
-        self.changed.emit()
+        if self._parse_definition_cached(text.strip()) is not None:
+            set_edit_style(self.definition_field._edit, VALID_QSS, "")
+        else:
+            set_edit_style(
+                self.definition_field._edit,
+                INVALID_QSS,
+                "Expected format: > 10.0 or < -3",
+            )
+        self._schedule_changed()
 
     def _on_name_changed(self, text: str) -> None:
         """
@@ -249,33 +411,24 @@ class ConstraintFunction(QWidget):
           - must not contain ANY whitespace
           - only letters, digits, underscore allowed
         """
-        import re
-        
         name = text  # do NOT strip; "Constraint1 " should be invalid
 
-        if not name or any(ch.isspace() for ch in name):
-            is_valid = False
-        else:
-            is_valid = bool(re.fullmatch(r"[A-Za-z0-9_]+", name))         
+        is_valid = bool(name) and not name.translate(_NAME_KILL_TABLE)
 
         self._set_name_valid(is_valid)
 
     def _set_name_valid(self, valid: bool) -> None:
-        if self._name_valid == valid:
-            return
-        self._name_valid = valid
-
         # underlying QLineEdit from StringField
         edit = self.name_field._edit  # adapt if your StringField exposes it differently
 
         if valid:
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
         else:
-            edit.setStyleSheet(self._invalid_name_style)
-            edit.setToolTip(
+            set_edit_style(
+                edit,
+                INVALID_QSS,
                 "Invalid name. Use only letters, digits, and underscore; "
-                "no spaces or special characters."
+                "no spaces or special characters.",
             )
 
     # --------------------------------------------------
@@ -285,13 +438,12 @@ class ConstraintFunction(QWidget):
         """
         Validate that the Training data file is a .csv and show a red border if not.
         """
-        # find the training-data widgets (2nd entry)
-        if not hasattr(self.file_fields, "_fields") or len(self.file_fields._fields) < 2:
-            return
-
-        _lbl_tr, edit_tr, _btn_tr = self.file_fields._fields[1]
+        edit_tr = self._tr_edit
 
         filename = (text or "").strip()
+        if filename == self._last_training:
+            return
+        self._last_training = filename
         if not filename:
             # empty is considered invalid
             self._set_training_file_valid(
@@ -301,7 +453,8 @@ class ConstraintFunction(QWidget):
             )
             return
 
-        if filename.lower().endswith(".csv"):
+        # lower-case only the 4-char suffix, not the whole path
+        if filename[-4:].lower() == ".csv":
             self._set_training_file_valid(valid=True, tooltip="", edit=edit_tr)
         else:
             self._set_training_file_valid(
@@ -314,17 +467,19 @@ class ConstraintFunction(QWidget):
         """
         Simple visual validation: red border on invalid, normal on valid.
         """
-        if valid:
-            edit.setStyleSheet("")
-        else:
-            edit.setStyleSheet(
-                "QLineEdit { border: 2px solid red; border-radius: 3px; }"
-            )
-        edit.setToolTip(tooltip)
+        set_edit_style(edit, VALID_QSS if valid else INVALID_QSS, tooltip)
 
     # --------------------------------------------------
     # Filename validation for design/output files
     # --------------------------------------------------
+    @pyqtSlot()
+    def _validate_design_filename(self) -> None:
+        self._validate_filename_field(2)
+
+    @pyqtSlot()
+    def _validate_output_filename(self) -> None:
+        self._validate_filename_field(3)
+
     def _validate_filename_field(self, index: int) -> None:
         """
         Validate file name (basename) for:
@@ -334,232 +489,284 @@ class ConstraintFunction(QWidget):
         Regex:
           ^[A-Za-z0-9][A-Za-z0-9 _.-]{0,198}[A-Za-z0-9]$
         """
-        if not hasattr(self, "file_fields") or not hasattr(self.file_fields, "_fields"):
-            return
-        if index >= len(self.file_fields._fields):
-            return
-
-        _lbl, edit, _btn = self.file_fields._fields[index]
-        if not isinstance(edit, QLineEdit):
-            return
+        edit = self._design_edit if index == 2 else self._output_edit
 
         path = (edit.text() or "").strip()
+        # same text as the last check (e.g. only whitespace changed): nothing to do
+        if self._last_filename.get(index) == path:
+            return
+        self._last_filename[index] = path
 
         # allow empty (no error styling)
         if not path:
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
             return
 
         name = os.path.basename(path)
-        pattern = re.compile(r"^[A-Za-z0-9][A-Za-z0-9 _\.-]{0,198}[A-Za-z0-9]$")
-        ok = bool(pattern.fullmatch(name))
+        ok = _FILENAME_RE.fullmatch(name) is not None
 
         if ok:
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
         else:
-            edit.setStyleSheet(self._invalid_name_style)
-            edit.setToolTip(
+            set_edit_style(
+                edit,
+                INVALID_QSS,
                 "Invalid filename. Allowed: letters/digits; may include space, underscore, dot, hyphen; "
-                "must start and end with a letter/digit; length 2-200."
+                "must start and end with a letter/digit; length 2-200.",
             )
 
     # ==================================================
     # Core logic
     # ==================================================
 
-    def clear_fields(self) -> None:
-        self.name_field.text = self._default_name
-        self.alias_field.text = ""  # NEW: Clear alias field
-        self.execution_location_field.value = self._default_execution_location
-        self.definition_field.text = ""
-        self.file_fields.set_paths(list(self._default_paths))
-        self.working_dir_field.path = self._default_workdir
-        self.remote_server_widget.setVisible(False)
-        self.remote_server_widget.set_values(
-            hostname="", username="", port="22"
+    @contextmanager
+    def _bulk_update(self):
+        """
+        Hold back repaints and child-field signals while many fields are set,
+        then run every validator once and schedule a single `changed`
+        (from_xml cancels it again).
+        """
+        fields = (
+            self.name_field,
+            self.alias_field,
+            self.execution_location_field,
+            self.definition_field,
+            self.file_fields,
+            self.working_dir_field,
+            # file-row edits this widget listens to directly, not via file_fields
+            self._tr_edit,
+            self._design_edit,
+            self._output_edit,
         )
-        self.changed.emit()
+        self.group_box.setUpdatesEnabled(False)
+        was_blocked = [f.blockSignals(True) for f in fields]
+        try:
+            yield
+        finally:
+            for f, blocked in zip(fields, was_blocked):
+                f.blockSignals(blocked)
+            self._pending_validation.update(("name", "definition", "training"))
+            self._flush_validation()
+            self._validate_design_filename()
+            self._validate_output_filename()
+            # paths were just reassigned; re-apply the alias state unconditionally,
+            # but keep the assigned paths (shown in the disabled rows) as the
+            # baseline did by setting the alias before the paths
+            self._alias_active_state = None
+            self._on_alias_changed(self.alias_field.text, clear=False)
+            self._on_execution_location_changed(self.execution_location_field.value)
+            self.group_box.setUpdatesEnabled(True)
+
+    def clear_fields(self) -> None:
+        with self._bulk_update():
+            self.name_field.text = self._default_name
+            self.alias_field.text = ""  # NEW: Clear alias field
+            self.execution_location_field.value = self._default_execution_location
+            self.definition_field.text = ""
+            self.file_fields.set_paths(self._default_paths)
+            self.working_dir_field.path = self._default_workdir
+            if self.remote_server_widget is not None:
+                self.remote_server_widget.set_values(
+                    hostname="", username="", port="22"
+                )
 
     def snapshot(self) -> Dict[str, str | Dict[str, str]]:
-        paths = self.file_fields.paths
-        data: Dict[str, str | Dict[str, str]] = {
-            "name": self.name_field.text.strip(),
-            "alias": self.alias_field.text.strip(),  # NEW: Include alias in snapshot
-            "execution_location": self.execution_location_field.value.strip(),
-            "definition": self.definition_field.text.strip(),
-            "executable_filename": paths[0],
-            "training_data_filename": paths[1],
-            "design_vector_filename": paths[2],
-            "output_filename": paths[3],
-            "working_directory": self.working_dir_field.path.strip(),
-        }
-        if self.execution_location_field.value.lower() == "remote":
+        """
+        Current values with surrounding whitespace removed.
+        """
+        data: Dict[str, str | Dict[str, str]] = self._collect()
+        if self._is_remote and self.remote_server_widget is not None:
             data["remote_server"] = self.remote_server_widget.snapshot()
         return data
 
+    def _collect(self) -> Dict[str, str]:
+        """
+        Stripped text of every own field, read once; shared by snapshot and to_xml.
+        """
+        paths = self.file_fields.paths
+        return {
+            "name": _strip(self.name_field.text),
+            "alias": _strip(self.alias_field.text),  # NEW: Include alias in snapshot
+            "execution_location": _strip(self.execution_location_field.value),
+            "definition": _strip(self.definition_field.text),
+            "executable_filename": _strip(paths[0]),
+            "training_data_filename": _strip(paths[1]),
+            "design_vector_filename": _strip(paths[2]),
+            "output_filename": _strip(paths[3]),
+            "working_directory": _strip(self.working_dir_field.path),
+        }
+
     # ==================================================
     # XML
     # ==================================================
 
     def to_xml(self, *, include_empty: bool = False) -> ET.Element:
-        root = ET.Element("constraint_function")
-
-        def add(tag: str, text: str):
-            if text or include_empty:
-                ET.SubElement(root, tag).text = text
-
-        add("name", self.name_field.text.strip())
-        add("alias", self.alias_field.text.strip())  # NEW: Add alias to XML
-        add("execution_location", self.execution_location_field.value.strip())
-
-        s = self.definition_field.text.strip()
-        if self._is_valid_definition(s):
-            m = re.match(r'^([<>])\s*([+-]?\d+(\.\d+)?)$', s)
-            op, val = m.group(1), m.group(2)
-            add("constraint_type", "gt" if op == ">" else "lt")
-            add("constraint_value", val)
-
-        tags = [
-            "executable_filename",
-            "training_data_filename",
-            "design_vector_filename",
-            "output_filename",
+        root = ET.Element(_XML_TAG)
+        snap = self._collect()
+
+        items: list[tuple[str, str]] = [
+            ("name", snap["name"]),
+            ("alias", snap["alias"]),  # NEW: Add alias to XML
+            ("execution_location", snap["execution_location"]),
         ]
-        for tag, val in zip(tags, self.file_fields.paths):
-            add(tag, val.strip())
 
-        add("working_directory", self.working_dir_field.path.strip())
+        parsed = self._parse_definition_cached(snap["definition"])
+        if parsed is not None:
+            op, _value, val = parsed
+            items.append(("constraint_type", "gt" if op == ">" else "lt"))
+            items.append(("constraint_value", val))
+
+        items.extend((tag, snap[tag]) for tag in self._FILE_TAGS)
+        items.append(("working_directory", snap["working_directory"]))
+
+        # one tight pass builds every text child, then a single extend
+        children = [
+            _text_element(tag, text)
+            for tag, text in items
+            if text or include_empty
+        ]
 
-        if self.execution_location_field.value.lower() == "remote":
-            root.append(self.remote_server_widget.to_xml("remote_server"))
+        if self._is_remote and self.remote_server_widget is not None:
+            children.append(self.remote_server_widget.to_xml("remote_server"))
 
+        root.extend(children)
         return root
 
     def from_xml(self, element: ET.Element) -> None:
+        # one pass over the children; first occurrence wins, like element.find()
+        by_tag: Dict[str, ET.Element] = {}
+        for child in element:
+            by_tag.setdefault(child.tag, child)
+
         def get(tag: str) -> str:
-            el = element.find(tag)
+            el = by_tag.get(tag)
             return el.text.strip() if el is not None and el.text else ""
 
-        self.name_field.text = get("name") or self._default_name
-       
-        self.alias_field.text = get("alias")  # NEW: Load alias from XML
-        loc = get("execution_location") or self._default_execution_location
-        self.execution_location_field.value = loc
-        self.remote_server_widget.setVisible(loc.lower() == "remote")
-
-        ctype = get("constraint_type")
-        cval = get("constraint_value")
-        if ctype and cval:
-            # accept both legacy and new forms
-            if ctype.lower() == "gt":
-                op = ">"
-            elif ctype.lower() == "lt":
-                op = "<"
-            elif ctype in (">", "<"):
-                op = ctype
-            else:
-                op = ""
-            if op:
-                self.definition_field.text = f"{op} {cval}"
-
-        self.file_fields.set_paths([
-            get("executable_filename"),
-            get("training_data_filename"),
-            get("design_vector_filename"),
-            get("output_filename"),
-        ])
-
-        wd = get("working_directory")
-        if wd:
-            self.working_dir_field.path = wd
-
-        rs_el = element.find("remote_server")
-        if rs_el is not None:
-            self.remote_server_widget.from_xml(rs_el)
-            self.remote_server_widget.setVisible(True)
-
-        self._on_definition_changed(self.definition_field.text)
+        with self._bulk_update():
+            self.name_field.text = get("name") or self._default_name
+
+            self.alias_field.text = get("alias")  # NEW: Load alias from XML
+            loc = get("execution_location") or self._default_execution_location
+            self.execution_location_field.value = loc
+
+            ctype = get("constraint_type")
+            cval = get("constraint_value")
+            if ctype and cval:
+                # accept both legacy and new forms
+                if ctype.lower() == "gt":
+                    op = ">"
+                elif ctype.lower() == "lt":
+                    op = "<"
+                elif ctype in (">", "<"):
+                    op = ctype
+                else:
+                    op = ""
+                if op:
+                    self.definition_field.text = f"{op} {cval}"
+
+            self.file_fields.set_paths([get(t) for t in self._FILE_TAGS])
+
+            wd = get("working_directory")
+            if wd:
+                self.working_dir_field.path = wd
+
+            rs_el = by_tag.get("remote_server")
+            if rs_el is not None:
+                rs = self._ensure_remote_widget()
+                rs.from_xml(rs_el)
+
+        # loading is not an edit: only user changes should reach `changed` listeners
+        self._changed_timer.stop()
 
     # --------------------------------------------------
     def _on_execution_location_changed(self, value: str) -> None:
-        self.remote_server_widget.setVisible(
-            value.strip().lower() == "remote"
-        )
-        self.changed.emit()
+        is_remote = self._is_remote = value.strip().lower() == _REMOTE
+        if is_remote:
+            self._ensure_remote_widget()
+        if self.remote_server_widget is not None:
+            self.remote_server_widget.setVisible(is_remote)
+        self._schedule_changed()
+
+    def _ensure_remote_widget(self) -> RemoteServerWidget:
+        """Build the remote-server block on first use; later calls return it."""
+        rs = self.remote_server_widget
+        if rs is None:
+            rs = RemoteServerWidget(
+                label_width=self._label_width,
+                field_width=self._field_width,
+                parent=self.group_box,
+            )
+            self._inner_layout.insertWidget(self._remote_index, rs)
+            rs.changed.connect(self._schedule_changed)
+            self.remote_server_widget = rs
+        return rs
 
     # --------------------------------------------------
     # Alias behavior: disables executable when alias is set
     # --------------------------------------------------
-    def _on_alias_changed(self, text: str) -> None:
+    def _on_alias_changed(self, text: str, *, clear: bool = True) -> None:
         """
         Alias rules:
           - empty is allowed
           - if non-empty: only letters/digits/underscore; no whitespace
         Invalid alias is shown with a red border.
+        `clear` is passed on to _sync_executable_with_alias.
         """
         alias = text  # do NOT strip; "abc " should be invalid
 
-        if not alias:
-            valid = True
-        elif any(ch.isspace() for ch in alias):
-            valid = False
-        else:
-            valid = bool(re.fullmatch(r"[A-Za-z0-9_]+", alias))
+        # empty is fine; otherwise nothing may survive deleting the allowed chars
+        valid = not alias or not alias.translate(_NAME_KILL_TABLE)
 
         # apply red-border feedback to alias field's QLineEdit
-        edit = self.alias_field.findChild(QLineEdit)
-        if edit is not None:
-            if valid:
-                edit.setStyleSheet("")
-                edit.setToolTip("")
-            else:
-                edit.setStyleSheet(self._invalid_name_style)
-                edit.setToolTip(
-                    "Invalid alias. Use only letters, digits, and underscore; "
-                    "no spaces or special characters."
-                )
+        edit = self.alias_field._edit
+        if valid:
+            set_edit_style(edit, VALID_QSS, "")
+        else:
+            set_edit_style(
+                edit,
+                INVALID_QSS,
+                "Invalid alias. Use only letters, digits, and underscore; "
+                "no spaces or special characters.",
+            )
 
-        self._sync_executable_with_alias()
-        self.changed.emit()
+        self._sync_executable_with_alias(clear=clear)
+        self._schedule_changed()
 
-    def _sync_executable_with_alias(self) -> None:
+    def _sync_executable_with_alias(self, *, clear: bool = True) -> None:
         """
         If alias is non-empty:
           - clear & disable 'Executable file name' (index 0)
           - clear & disable 'Design variables file' (index 2)
         Else:
           - re-enable both
+        Does nothing while the alias stays empty or stays non-empty.
+        With clear=False the rows are only disabled and restyled, keeping
+        their text (used after loading, where the paths come from the file).
         """
-        if not hasattr(self, "file_fields") or not hasattr(self.file_fields, "_fields"):
-            return
-        if not self.file_fields._fields:
-            return
-
         alias_active = bool((self.alias_field.text or "").strip())
-        inactive_style = "QLineEdit { background: #f0f0f0; color: #666; }"
+        # only an empty <-> non-empty transition changes the rows
+        if alias_active == self._alias_active_state:
+            return
+        self._alias_active_state = alias_active
 
-        def _toggle_index(i: int) -> None:
-            if i >= len(self.file_fields._fields):
-                return
-            _lbl, edit, btn = self.file_fields._fields[i]
+        for edit, btn in (
+            (self._exe_edit, self._exe_btn),          # "Executable file name"
+            (self._design_edit, self._design_btn),    # NEW: "Design variables file"
+        ):
             if alias_active:
-                edit.blockSignals(True)
-                edit.setText("")
-                edit.blockSignals(False)
+                if clear:
+                    edit.blockSignals(True)
+                    edit.setText("")
+                    edit.blockSignals(False)
                 edit.setEnabled(False)
                 btn.setEnabled(False)
-                edit.setStyleSheet(inactive_style)
+                set_edit_style(edit, INACTIVE_QSS)
             else:
                 edit.setEnabled(True)
                 btn.setEnabled(True)
-                edit.setStyleSheet("")
-
-        # index 0 == "Executable file name"
-        _toggle_index(0)
-        # NEW: index 2 == "Design variables file"
-        _toggle_index(2)
+                set_edit_style(edit, VALID_QSS)
+        # styles were replaced above; the next filename check must run in full
+        self._last_filename.clear()
 
     # --- public API for Study ---
 
@@ -1,20 +1,46 @@
 # csv_table_updater.py
 import csv
+import io
 import os
+import stat
 from typing import Optional
 
 from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtCore import Qt
 
 from xml_inspector import XMLInspector
 
 
 class CSVTableUpdater:
+    # built once instead of per row / per cell
+    _COL_YES = QColor("#2ECC71")
+    _COL_NO = QColor("#E74C3C")
+    _COL_HI = QColor("#fff9d6")
+    _BRUSH_HI = QBrush(_COL_HI)
+    _BRUSH_NONE = QBrush()
+    _ALIGN = Qt.AlignmentFlag.AlignCenter
+    _NOT_EDITABLE = ~Qt.ItemFlag.ItemIsEditable
+
     def __init__(self, table: QTableWidget):
         self.table = table
         self._last_mtime = 0.0
 
+        # incremental parse state: rows from complete lines already read, the
+        # byte offset just past them (the history CSV is only appended to), and
+        # the last of those lines, re-read to check the prefix is unchanged
+        self._csv_path: Optional[str] = None
+        self._start_time = 0.0
+        self._offset = 0
+        self._last_line = b""
+        self._rows: list[list[str]] = []
+
+        # (xml_path, mtime, num_objectives, num_constraints) of the last parse
+        self._xml_cache: Optional[tuple[str, float, int, int]] = None
+
+        # table items, one list per row, reused by every refresh
+        self._items: list[list[QTableWidgetItem]] = []
+
     def update(
         self,
         *,
@@ -31,12 +57,22 @@ class CSVTableUpdater:
         if not start_time:
             return
 
-        # If CSV doesn't exist yet, do nothing
-        if not csv_path or not os.path.isfile(csv_path):
+        # nothing is seen while the table is hidden (e.g. another tab is
+        # showing); _last_mtime stays put, so the first visible call catches up
+        if not self.table.isVisible():
+            return
+
+        # If CSV doesn't exist yet, do nothing (one stat gives type, mtime and size)
+        if not csv_path:
+            return
+        try:
+            st = os.stat(csv_path)
+        except OSError:
+            return
+        if not stat.S_ISREG(st.st_mode):
             return
 
-        mtime = os.path.getmtime(csv_path)
-       
+        mtime = st.st_mtime
 
         # NEW: ignore CSV files from a previous run (created/modified before this run started)
         if mtime < start_time:
@@ -47,8 +83,7 @@ class CSVTableUpdater:
 
         self._last_mtime = mtime
 
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            rows = list(csv.reader(f))
+        rows = self._read_rows(csv_path, start_time, st.st_size)
         if len(rows) < 2:
             return
 
@@ -59,9 +94,8 @@ class CSVTableUpdater:
         if dim >= n_cols:
             return
 
-        xml = XMLInspector(xml_path)
-        num_objectives = max(xml.num_objectives(), 1)
-        num_constraints = xml.num_constraints()
+        num_objectives, num_constraints = self._xml_counts(xml_path)
+        num_objectives = max(num_objectives, 1)
 
         feas_col = n_cols - 1
         obj_cols = list(range(dim, min(dim + num_objectives, n_cols)))
@@ -81,6 +115,70 @@ class CSVTableUpdater:
 
         self.table.scrollToBottom()
 
+    def _xml_counts(self, xml_path: str) -> tuple[int, int]:
+        """
+        (objective, constraint) counts of the study XML, re-parsed only when
+        the file's mtime changes.
+        """
+        try:
+            mtime = os.stat(xml_path).st_mtime
+        except OSError:
+            mtime = None
+
+        cache = self._xml_cache
+        if mtime is not None and cache is not None and cache[:2] == (xml_path, mtime):
+            return cache[2], cache[3]
+
+        xml = XMLInspector(xml_path)
+        counts = (xml.num_objectives(), xml.num_constraints())
+        if mtime is not None:
+            self._xml_cache = (xml_path, mtime, *counts)
+        return counts
+
+    def _read_rows(self, csv_path: str, start_time: float, size: int) -> list[list[str]]:
+        """
+        All CSV rows, parsing only what was appended since the last call.
+        Starts over for a new file or run, if the file shrank, or if the last
+        line already parsed no longer reads the same (file rewritten in place).
+        """
+        if (
+            csv_path != self._csv_path
+            or start_time != self._start_time
+            or size < self._offset
+        ):
+            self._reset_rows(csv_path, start_time)
+
+        with open(csv_path, "rb") as f:
+            last = self._last_line
+            f.seek(self._offset - len(last))
+            chunk = f.read()
+            if not chunk.startswith(last):
+                self._reset_rows(csv_path, start_time)
+                f.seek(0)
+                chunk = f.read()
+            else:
+                chunk = chunk[len(last):]
+
+        # commit complete lines only; a trailing partial line (still being
+        # written, or a last row without newline) is parsed but re-read next time
+        cut = chunk.rfind(b"\n") + 1
+        if cut:
+            done = chunk[:cut]
+            self._rows.extend(csv.reader(io.StringIO(done.decode("utf-8"), newline="")))
+            self._offset += cut
+            self._last_line = done[done.rfind(b"\n", 0, cut - 1) + 1:]
+        tail = chunk[cut:]
+        if not tail:
+            return self._rows
+        return self._rows + list(csv.reader(io.StringIO(tail.decode("utf-8", "replace"), newline="")))
+
+    def _reset_rows(self, csv_path: str, start_time: float) -> None:
+        self._csv_path = csv_path
+        self._start_time = start_time
+        self._offset = 0
+        self._last_line = b""
+        self._rows = []
+
     # ------------------------------------------------------------
     # --- Analysis ---
     # ------------------------------------------------------------
@@ -88,25 +186,24 @@ class CSVTableUpdater:
         pareto = set()
         best_idx = None
 
-        if len(obj_cols) == 1:
-            feasible = [
-                (i, float(row[obj_cols[0]]))
-                for i, row in enumerate(data)
-                if feas_col < len(row) and self._is_float(row[feas_col])
-                and float(row[feas_col]) == 1.0
-            ]
-            if feasible:
-                best_idx, _ = min(feasible, key=lambda x: x[1])
-
-        elif len(obj_cols) == 2:
-            feasible_points = []
-            for i, row in enumerate(data):
-                try:
-                    if float(row[feas_col]) == 1.0:
-                        feasible_points.append((i, [float(row[c]) for c in obj_cols]))
-                except Exception:
-                    continue
+        if len(obj_cols) not in (1, 2):
+            return pareto, best_idx
 
+        # one pass, each needed cell parsed once; rows that are infeasible or
+        # have a non-numeric objective are left out
+        to_float = self._to_float
+        feasible_points = []
+        for i, row in enumerate(data):
+            if feas_col >= len(row) or to_float(row[feas_col]) != 1.0:
+                continue
+            values = [to_float(row[c]) if c < len(row) else None for c in obj_cols]
+            if None not in values:
+                feasible_points.append((i, values))
+
+        if len(obj_cols) == 1:
+            if feasible_points:
+                best_idx, _ = min(feasible_points, key=lambda x: x[1][0])
+        else:
             pareto = self._pareto_indices([v for _, v in feasible_points])
             pareto = {feasible_points[i][0] for i in pareto}
 
@@ -114,17 +211,37 @@ class CSVTableUpdater:
 
     @staticmethod
     def _pareto_indices(values):
+        """
+        Indices of the non-dominated points among 2-objective `values`
+        (minimisation), via one sort and a sweep: O(n log n) instead of
+        comparing every pair.
+        """
         pareto = set()
-        for i, vi in enumerate(values):
-            dominated = False
-            for j, vj in enumerate(values):
-                if i == j:
-                    continue
-                if all(a <= b for a, b in zip(vj, vi)) and any(a < b for a, b in zip(vj, vi)):
-                    dominated = True
-                    break
-            if not dominated:
+        order = []
+        for i, (x, y) in enumerate(values):
+            if x != x or y != y:
+                # NaN compares false both ways: it neither dominates nor is dominated
                 pareto.add(i)
+            else:
+                order.append(i)
+        order.sort(key=lambda i: values[i])
+
+        best_y = None  # smallest y among points with a strictly smaller x
+        k, n = 0, len(order)
+        while k < n:
+            x = values[order[k]][0]
+            end = k
+            while end < n and values[order[end]][0] == x:
+                end += 1
+            # points sharing this x: sorted by y, so the first has the group minimum
+            group_min = values[order[k]][1]
+            for i in order[k:end]:
+                y = values[i][1]
+                if (best_y is None or best_y > y) and not group_min < y:
+                    pareto.add(i)
+            if best_y is None or group_min < best_y:
+                best_y = group_min
+            k = end
         return pareto
 
     # ------------------------------------------------------------
@@ -141,46 +258,82 @@ class CSVTableUpdater:
         num_objectives,
         num_constraints,
     ):
-        self.table.clear()
-        self.table.setColumnCount(len(headers) + 1)
-        self.table.setRowCount(len(data))
-        self.table.setHorizontalHeaderLabels(["ID"] + headers)
-
-        for i, row in enumerate(data):
-            id_text = f"★ {i+1}" if i == best_idx or i in pareto_indices else str(i + 1)
-            id_item = QTableWidgetItem(id_text)
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(i, 0, id_item)
-
-            for j, val in enumerate(row):
-                col = j + 1
-                item = QTableWidgetItem(val)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-                if j == feas_col:
-                    if self._is_float(val) and float(val) == 1.0:
-                        item.setText("Yes")
-                        item.setForeground(QColor("#2ECC71"))
+        table = self.table
+        sorting = table.isSortingEnabled()
+        # one repaint and no per-cell signals or re-sorting while the rows are filled
+        table.setUpdatesEnabled(False)
+        blocked = table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            n_cols = len(headers) + 1
+            if table.columnCount() != n_cols or not self._items_intact():
+                table.clear()
+                table.setColumnCount(n_cols)
+                self._items = []
+            table.setHorizontalHeaderLabels(["ID"] + headers)
+
+            # keep the items across refreshes: allocate only for new rows
+            del self._items[len(data):]
+            table.setRowCount(len(data))
+            for i in range(len(self._items), len(data)):
+                cells = []
+                for j in range(n_cols):
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(self._ALIGN)
+                    item.setFlags(item.flags() & self._NOT_EDITABLE)
+                    table.setItem(i, j, item)
+                    cells.append(item)
+                self._items.append(cells)
+
+            # rows to highlight, flagged once up front instead of tested per row
+            highlighted = [False] * len(data)
+            for i in pareto_indices:
+                highlighted[i] = True
+            if best_idx is not None:
+                highlighted[best_idx] = True
+
+            for i, (row, cells, highlight) in enumerate(zip(data, self._items, highlighted)):
+                background = self._BRUSH_HI if highlight else self._BRUSH_NONE
+
+                cells[0].setText(f"★ {i+1}" if highlight else str(i + 1))
+                cells[0].setBackground(background)
+
+                for j in range(n_cols - 1):
+                    item = cells[j + 1]
+                    val = row[j] if j < len(row) else ""
+                    if j == feas_col and j < len(row):
+                        if self._to_float(val) == 1.0:
+                            item.setText("Yes")
+                            item.setForeground(self._COL_YES)
+                        else:
+                            item.setText("No")
+                            item.setForeground(self._COL_NO)
                     else:
-                        item.setText("No")
-                        item.setForeground(QColor("#E74C3C"))
-
-                self.table.setItem(i, col, item)
-
-            if i == best_idx or i in pareto_indices:
-                for j in range(len(headers) + 1):
-                    cell = self.table.item(i, j)
-                    if cell:
-                        cell.setBackground(QColor("#fff9d6"))
-
-        self._hide_columns(
-            len(headers),
-            obj_cols,
-            feas_col,
-            num_objectives,
-            num_constraints,
+                        item.setText(val)
+                    item.setBackground(background)
+
+            self._hide_columns(
+                len(headers),
+                obj_cols,
+                feas_col,
+                num_objectives,
+                num_constraints,
+            )
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(blocked)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def _items_intact(self) -> bool:
+        """False if the table's items were deleted behind our back (e.g. cleared for a fresh run)."""
+        items = self._items
+        if not items:
+            return True
+        return (
+            self.table.rowCount() >= len(items)
+            and self.table.item(0, 0) is items[0][0]
+            and self.table.item(len(items) - 1, 0) is items[-1][0]
         )
 
     def _hide_columns(self, n_headers, obj_cols, feas_col, num_objectives, num_constraints):
@@ -189,13 +342,18 @@ class CSVTableUpdater:
         if num_constraints > 0:
             keep.add(feas_col + 1)
 
+        # keep changes only with the objective/constraint counts, so in steady
+        # state this touches no column at all
+        table = self.table
         for j in range(n_headers + 1):
-            self.table.setColumnHidden(j, j not in keep)
+            hide = j not in keep
+            if table.isColumnHidden(j) != hide:
+                table.setColumnHidden(j, hide)
 
     @staticmethod
-    def _is_float(s: str) -> bool:
+    def _to_float(s: str) -> Optional[float]:
+        """float(s), or None if s is not a number."""
         try:
-            float(s)
-            return True
-        except Exception:
-            return False
+            return float(s)
+        except ValueError:
+            return None
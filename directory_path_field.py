@@ -1,14 +1,27 @@
 from __future__ import annotations
+from functools import lru_cache, partial
 from typing import Optional, Sequence
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout,
-    QFileDialog, QApplication, QSizePolicy
+    QFileDialog, QFileIconProvider, QApplication, QSizePolicy
 )
 from PyQt6.QtCore import pyqtSignal, QSize
 from PyQt6.QtGui import QIcon
 import sys, os, re
 from xml.etree import ElementTree as ET
 
+# runs of non-alphanumerics (underscores included) become one "_" in XML tags
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Za-z]+")
+
+
+@lru_cache(maxsize=256)
+def _sanitize_tag(label: str) -> str:
+    """XML tag for a field label; labels are a small fixed set, so results are cached."""
+    s = _NON_ALNUM_RE.sub("_", label).strip("_")
+    if not s or s[0].isdigit():
+        s = "d_" + (s or "directory")
+    return s
+
 
 class DirectoryPathField(QWidget):
     """
@@ -23,6 +36,32 @@ class DirectoryPathField(QWidget):
     """
     pathChanged = pyqtSignal(str)
 
+    # browse icon, loaded on first use and shared by every instance
+    _folder_icon: Optional[QIcon] = None
+    _folder_icon_loaded = False
+
+    @classmethod
+    def _get_folder_icon(cls) -> Optional[QIcon]:
+        """The folder icon, or None if the image is missing."""
+        if not cls._folder_icon_loaded:
+            icon_path = os.path.join("images", "folder_open.svg")
+            cls._folder_icon = QIcon(icon_path) if os.path.exists(icon_path) else None
+            cls._folder_icon_loaded = True
+        return cls._folder_icon
+
+    # icon provider for the browse dialog that skips per-folder custom icons
+    # (each one is an extra file read, slow on network shares); created on
+    # first browse because it needs the QApplication
+    _icon_provider: Optional[QFileIconProvider] = None
+
+    @classmethod
+    def _get_icon_provider(cls) -> QFileIconProvider:
+        if cls._icon_provider is None:
+            provider = QFileIconProvider()
+            provider.setOptions(QFileIconProvider.Option.DontUseCustomDirectoryIcons)
+            cls._icon_provider = provider
+        return cls._icon_provider
+
     def __init__(
         self,
         name: str | Sequence[str],
@@ -49,7 +88,8 @@ class DirectoryPathField(QWidget):
 
         self._fields: list[tuple[QLabel, QLineEdit, QPushButton]] = []
 
-        outer_layout = QVBoxLayout(self) if len(names) > 1 else QHBoxLayout(self)
+        # one row per name, stacked; a single field is just a one-row stack
+        outer_layout = QVBoxLayout(self)
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setSpacing(6)
 
@@ -84,9 +124,9 @@ class DirectoryPathField(QWidget):
             if button_size > 0:
                 btn.setFixedSize(QSize(button_size, button_size))
 
-            icon_path = os.path.join("images", "folder_open.svg")
-            if os.path.exists(icon_path):
-                btn.setIcon(QIcon(icon_path))
+            icon = self._get_folder_icon()
+            if icon is not None:
+                btn.setIcon(icon)
                 btn.setIconSize(
                     QSize(max(1, button_size - 2), max(1, button_size - 2))
                 )
@@ -102,9 +142,12 @@ class DirectoryPathField(QWidget):
             self._fields.append((label, edit, btn))
             outer_layout.addLayout(row)
 
-            btn.clicked.connect(lambda _, e=edit: self._browse(e))
+            btn.clicked.connect(partial(self._browse, edit))
             edit.textChanged.connect(self.pathChanged.emit)
 
+        # XML tag of each row; the labels never change after construction
+        self._field_tags: list[str] = [_sanitize_tag(lbl.text()) for lbl, _, _ in self._fields]
+
         self.setLayout(outer_layout)
         self.setSizePolicy(
             QSizePolicy.Policy.Expanding,
@@ -124,8 +167,19 @@ class DirectoryPathField(QWidget):
         return [edit.text() for _, edit, _ in self._fields]
 
     def set_paths(self, paths: list[str]) -> None:
-        for (_, edit, _), p in zip(self._fields, paths, strict=False):
-            edit.setText(p)
+        # the edits still emit textChanged (per-row listeners see every row),
+        # but pathChanged fires once for the whole batch rather than per row
+        last: Optional[str] = None
+        blocked = self.blockSignals(True)
+        try:
+            for (_, edit, _), p in zip(self._fields, paths, strict=False):
+                if edit.text() != p:
+                    edit.setText(p)
+                    last = p
+        finally:
+            self.blockSignals(blocked)
+        if last is not None:
+            self.pathChanged.emit(last)
 
     @property
     def name(self) -> str:
@@ -149,7 +203,7 @@ class DirectoryPathField(QWidget):
         attr_label: str | None = None
     ) -> ET.Element:
         if len(self._fields) == 1:
-            safe_tag = root_tag or self._sanitize_tag(self.name)
+            safe_tag = root_tag or self._field_tags[0]
             el = ET.Element(safe_tag)
             el.text = self.path
             if attr_label:
@@ -157,8 +211,8 @@ class DirectoryPathField(QWidget):
             return el
 
         root = ET.Element(root_tag or "directories")
-        for lbl, edit, _ in self._fields:
-            child = ET.Element(self._sanitize_tag(lbl.text()))
+        for (lbl, edit, _), tag in zip(self._fields, self._field_tags):
+            child = ET.Element(tag)
             child.text = edit.text()
             if attr_label:
                 child.set(attr_label, lbl.text())
@@ -167,12 +221,12 @@ class DirectoryPathField(QWidget):
 
     def to_xml_string(self, **kwargs) -> str:
         el = self.to_xml(**kwargs)
-        return ET.tostring(el, encoding="utf-8").decode("utf-8")
+        return ET.tostring(el, encoding="unicode")
 
     def from_xml(self, element: ET.Element) -> None:
         if len(self._fields) == 1:
-            lbl, edit, _ = self._fields[0]
-            tag = self._sanitize_tag(lbl.text())
+            edit = self._fields[0][1]
+            tag = self._field_tags[0]
 
             if element.tag.lower() == tag.lower():
                 if element.text:
@@ -184,26 +238,17 @@ class DirectoryPathField(QWidget):
                 edit.setText(child.text.strip())
             return
 
-        paths: list[str] = []
-        for lbl, edit, _ in self._fields:
-            tag = self._sanitize_tag(lbl.text())
-            child = element.find(tag)
-            paths.append(child.text.strip() if child is not None and child.text else "")
-        self.set_paths(paths)
-
-    @staticmethod
-    def _sanitize_tag(label: str) -> str:
-        s = re.sub(r"[^0-9A-Za-z]+", "_", label).strip("_")
-        s = re.sub(r"_+", "_", s)
-        if not s or s[0].isdigit():
-            s = "d_" + (s or "directory")
-        return s
+        # one pass over the children; first occurrence wins, like element.find()
+        by_tag: dict[str, str] = {}
+        for child in element:
+            by_tag.setdefault(child.tag, child.text.strip() if child.text else "")
+        self.set_paths([by_tag.get(tag, "") for tag in self._field_tags])
 
     # --------------------------------------------------
     # Browsing
     # --------------------------------------------------
 
-    def _browse(self, edit: QLineEdit) -> None:
+    def _browse(self, edit: QLineEdit, _checked: bool = False) -> None:
         if not self._browse_enabled:
             return
 
@@ -211,6 +256,9 @@ class DirectoryPathField(QWidget):
         dlg.setOption(QFileDialog.Option.DontUseNativeDialog, True)
         dlg.setFileMode(QFileDialog.FileMode.Directory)
         dlg.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        dlg.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+        dlg.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+        dlg.setIconProvider(self._get_icon_provider())
         dlg.setFixedSize(self._dialog_width, self._dialog_height)
 
         if dlg.exec():
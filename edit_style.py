@@ -0,0 +1,29 @@
+# edit_style.py
+from __future__ import annotations
+from PyQt6.QtWidgets import QLineEdit
+
+
+# line-edit styles: invalid input, valid input, disabled by an alias
+INVALID_QSS = "QLineEdit { border: 2px solid red; border-radius: 3px; }"
+VALID_QSS = ""
+INACTIVE_QSS = "QLineEdit { background: #f0f0f0; color: #666; }"
+
+# dynamic property holding the QSS last applied by set_edit_style
+_QSS_PROPERTY = "rodopt_qss"
+
+
+def set_edit_style(edit: QLineEdit, qss: str, tooltip: str | None = None) -> None:
+    """
+    Apply a stylesheet (and optionally a tooltip) only if it differs from the
+    one last applied; the applied QSS is remembered on the edit itself.
+    """
+    if edit.property(_QSS_PROPERTY) != qss:
+        edit.setProperty(_QSS_PROPERTY, qss)
+        edit.setStyleSheet(qss)
+    if tooltip is not None and edit.toolTip() != tooltip:
+        edit.setToolTip(tooltip)
+
+
+def applied_edit_style(edit: QLineEdit) -> str | None:
+    """The QSS last applied to `edit` by set_edit_style, or None."""
+    return edit.property(_QSS_PROPERTY)
@@ -1,25 +1,25 @@
 #!/usr/bin/env python3
 
+import os
 import numpy as np
 import time
+from math import exp
 
 
 def evaluateFunction1(x: np.ndarray) -> float:
-    x1 = float(x[0])
-    x2 = float(x[1])
-    term1 = 3 * (1 - x1) ** 2 * np.exp(-x1**2 - (x2 + 1) ** 2)
-    term2 = 10 * (x1 / 5 - x1**3 - x2**5) * np.exp(-x1**2 - x2**2)
-    term3 = -3 * np.exp(-(x1 + 2) ** 2 - x2**2)
+    x1, x2 = x.tolist()  # plain floats, so the scalar math below skips numpy
+    term1 = 3 * (1 - x1) ** 2 * exp(-x1**2 - (x2 + 1) ** 2)
+    term2 = 10 * (x1 / 5 - x1**3 - x2**5) * exp(-x1**2 - x2**2)
+    term3 = -3 * exp(-(x1 + 2) ** 2 - x2**2)
     term4 = 0.5 * (2 * x1 + x2)
     return float(-(term1 + term2 + term3 + term4))
 
 
 def evaluateFunction2(x: np.ndarray) -> float:
-    x1 = float(x[0])
-    x2 = float(x[1])
-    term1 = 3 * (1 + x2) ** 2 * np.exp(-(1 - x1) ** 2 - x2**2)
-    term2 = -10 * (-x2 / 5 + x2**3 + x1**5) * np.exp(-x1**2 - x2**2)
-    term3 = -3 * np.exp(-(2 - x2) ** 2 - x1**2)
+    x1, x2 = x.tolist()
+    term1 = 3 * (1 + x2) ** 2 * exp(-(1 - x1) ** 2 - x2**2)
+    term2 = -10 * (-x2 / 5 + x2**3 + x1**5) * exp(-x1**2 - x2**2)
+    term3 = -3 * exp(-(2 - x2) ** 2 - x1**2)
     return float(-(term1 + term2 + term3))
 
 
@@ -27,15 +27,11 @@ def main() -> int:
 #    print("Evaluating objective functions...\n")
 
     dim = 2
-    dv = np.zeros(dim, dtype=float)
 
     try:
-        with open("dv.dat", "r", encoding="utf-8") as f:
-            for i in range(dim):
-                line = f.readline()
-                if not line:
-                    raise ValueError(f"dv.dat ended early at line {i + 1} (expected {dim} values).")
-                dv[i] = float(line.strip())
+        dv = np.loadtxt("dv.dat", dtype=np.float64, max_rows=dim, ndmin=1)
+        if dv.size != dim:
+            raise ValueError(f"dv.dat has {dv.size} values (expected {dim}).")
     except Exception as e:
         print(f"ERROR: Failed to read dv.dat: {e}")
         return 1
@@ -48,8 +44,9 @@ def main() -> int:
  #   print("function1 value =", functionValue1)
  #   print("function2 value =", functionValue2)
 
-    # NEW: delay before writing results
-    time.sleep(50)
+    # NEW: delay before writing results (RODOPT_NO_DELAY=1 skips it)
+    if not os.environ.get("RODOPT_NO_DELAY"):
+        time.sleep(50)
 
     try:
         with open("f1.dat", "w", encoding="utf-8") as f:
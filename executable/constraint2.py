@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import numpy as np
+import os
 import sys
 import time
 
@@ -10,18 +10,23 @@ def _read_delay_seconds(cfg_path: str, default: float) -> float:
       delay_seconds=0.5
       delay_seconds = 2
     Lines starting with # are ignored.
+    Returns 0 without reading anything when RODOPT_NO_DELAY is set.
     """
+    if os.environ.get("RODOPT_NO_DELAY"):
+        return 0
     try:
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            for line in f:
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                if "=" not in s:
-                    continue
-                k, v = (p.strip() for p in s.split("=", 1))
-                if k == "delay_seconds":
-                    return float(v)
+        # raw bytes: no text decoding for a file that is only ever ASCII
+        with open(cfg_path, "rb") as f:
+            data = f.read()
+        for line in data.splitlines():
+            s = line.strip()
+            if not s or s.startswith(b"#"):
+                continue
+            if b"=" not in s:
+                continue
+            k, v = (p.strip() for p in s.split(b"=", 1))
+            if k == b"delay_seconds":
+                return float(v)
     except FileNotFoundError:
         return default
     except Exception as e:
@@ -36,10 +41,8 @@ if delay_seconds > 0:
 
 # --- Read design vector ---
 dim = 2
-dv = np.zeros(dim)
 with open("dv.dat", "r") as f:
-    for i in range(dim):
-        dv[i] = float(f.readline())
+    dv = [float(f.readline()) for _ in range(dim)]
 
 # --- Evaluate constraint ---
 constraintValue = dv[0] * dv[0] + dv[1] * dv[1]
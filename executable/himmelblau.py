@@ -1,11 +1,13 @@
-import numpy as np
 import time
 import sys
 import os
 
 # Define the Himmelblau function
 def Himmelblau(x):
-    return (x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2
+    x0, x1 = x
+    u = x0 * x0 + x1 - 11
+    v = x0 + x1 * x1 - 7
+    return u * u + v * v
 
 
 def _read_delay_seconds(cfg_path: str, default: int) -> int:
@@ -15,18 +17,23 @@ def _read_delay_seconds(cfg_path: str, default: int) -> int:
       delay_seconds=31
       delay_seconds = 31
     Lines starting with # are ignored.
+    Returns 0 without reading anything when RODOPT_NO_DELAY is set.
     """
+    if os.environ.get("RODOPT_NO_DELAY"):
+        return 0
     try:
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            for line in f:
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                if "=" not in s:
-                    continue
-                k, v = (p.strip() for p in s.split("=", 1))
-                if k == "delay_seconds":
-                    return int(float(v))
+        # raw bytes: no text decoding for a file that is only ever ASCII
+        with open(cfg_path, "rb") as f:
+            data = f.read()
+        for line in data.splitlines():
+            s = line.strip()
+            if not s or s.startswith(b"#"):
+                continue
+            if b"=" not in s:
+                continue
+            k, v = (p.strip() for p in s.split(b"=", 1))
+            if k == b"delay_seconds":
+                return int(float(v))
     except FileNotFoundError:
         return default
     except Exception:
@@ -47,17 +54,21 @@ def main():
     try:
         # Read design variables
         with open(input_filename, "r") as f:
-            dv = np.array([float(f.readline()) for _ in range(dim)])
+            dv = [float(f.readline()) for _ in range(dim)]
 
         # Evaluate the function
         function_value = Himmelblau(dv)
 
         # Optional delay
-        time.sleep(delay_seconds)
+        if delay_seconds > 0:
+            time.sleep(delay_seconds)
 
         # Write the result (9 digits after decimal point)
-        with open(output_filename, "w") as f:
-            f.write(f"{function_value:.9f}\n")
+        fd = os.open(output_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, f"{function_value:.9f}\n".encode("ascii"))
+        finally:
+            os.close(fd)
 
     except Exception as e:
         # Print the error to stderr and exit with a non-zero code
@@ -1,15 +1,21 @@
-import numpy as np
+import os
 import time
 import sys
 
 
-def Himmelblau(x: np.ndarray) -> float:
-    return (x[0] ** 2 + x[1] - 11) ** 2 + (x[0] + x[1] ** 2 - 7) ** 2
+def Himmelblau(x: list[float]) -> float:
+    x0, x1 = x
+    u = x0 * x0 + x1 - 11
+    v = x0 + x1 * x1 - 7
+    return u * u + v * v
 
 
-def Rosenbrock(x: np.ndarray, a: float = 1.0, b: float = 100.0) -> float:
+def Rosenbrock(x: list[float], a: float = 1.0, b: float = 100.0) -> float:
     # Standard 2D Rosenbrock: (a - x)^2 + b(y - x^2)^2
-    return (a - x[0]) ** 2 + b * (x[1] - x[0] ** 2) ** 2
+    x0, x1 = x
+    u = a - x0
+    v = x1 - x0 * x0
+    return u * u + b * v * v
 
 
 def main():
@@ -18,18 +24,21 @@ def main():
     output_himmelblau = "himmelblau.dat"
     output_rosenbrock = "rosenbrock.dat"
     delay_seconds = 31  # keep same behavior as himmelblau.py
+    if os.environ.get("RODOPT_NO_DELAY"):
+        delay_seconds = 0
 
     try:
         # Read design variables
         with open(input_filename, "r") as f:
-            dv = np.array([float(f.readline()) for _ in range(dim)], dtype=float)
+            dv = [float(f.readline()) for _ in range(dim)]
 
         # Evaluate functions
         himmelblau_value = Himmelblau(dv)
         rosenbrock_value = Rosenbrock(dv)
 
         # Optional delay
-        time.sleep(delay_seconds)
+        if delay_seconds > 0:
+            time.sleep(delay_seconds)
 
         # Write results
         with open(output_himmelblau, "w") as f:
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 
-import numpy as np
 import time
 import sys
 import os
 
 # Define the Rosenbrock function
 def Rosenbrock(x):
-    return (1 - x[0])**2 + 100 * (x[1] - x[0]**2)**2
+    x0, x1 = x
+    u = 1 - x0
+    v = x1 - x0 * x0
+    return u * u + 100 * v * v
 
 
 def _read_delay_seconds(cfg_path: str, default: int) -> int:
@@ -17,18 +19,23 @@ def _read_delay_seconds(cfg_path: str, default: int) -> int:
       delay_seconds=21
       delay_seconds = 21
     Lines starting with # are ignored.
+    Returns 0 without reading anything when RODOPT_NO_DELAY is set.
     """
+    if os.environ.get("RODOPT_NO_DELAY"):
+        return 0
     try:
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            for line in f:
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                if "=" not in s:
-                    continue
-                k, v = (p.strip() for p in s.split("=", 1))
-                if k == "delay_seconds":
-                    return int(float(v))
+        # raw bytes: no text decoding for a file that is only ever ASCII
+        with open(cfg_path, "rb") as f:
+            data = f.read()
+        for line in data.splitlines():
+            s = line.strip()
+            if not s or s.startswith(b"#"):
+                continue
+            if b"=" not in s:
+                continue
+            k, v = (p.strip() for p in s.split(b"=", 1))
+            if k == b"delay_seconds":
+                return int(float(v))
     except FileNotFoundError:
         return default
     except Exception:
@@ -49,17 +56,21 @@ def main():
     try:
         # Read design variables
         with open(input_filename, "r") as f:
-            dv = np.array([float(f.readline()) for _ in range(dim)])
+            dv = [float(f.readline()) for _ in range(dim)]
 
         # Evaluate the function
         function_value = Rosenbrock(dv)
 
         # Optional delay
-        time.sleep(delay_seconds)
+        if delay_seconds > 0:
+            time.sleep(delay_seconds)
 
         # Write the result (9 digits after decimal point)
-        with open(output_filename, "w") as f:
-            f.write(f"{function_value:.9f}\n")
+        fd = os.open(output_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, f"{function_value:.9f}\n".encode("ascii"))
+        finally:
+            os.close(fd)
 
     except Exception as e:
         print(f"Error in Rosenbrock evaluation: {e}", file=sys.stderr)
@@ -9,8 +9,9 @@ def evaluate_function(x: np.ndarray) -> float:
     """Example nonlinear function with 42 variables."""
     if x.size != 42:
         raise ValueError(f"Expected 42 design variables, got {x.size}.")
-    # Nonlinear, multimodal, smooth
-    return np.sum(x**2 + 0.5 * np.sin(3 * x) + 0.2 * x**4)
+    # Nonlinear, multimodal, smooth: x^2 + 0.2 x^4 = x^2 (1 + 0.2 x^2), squaring once
+    x2 = x * x
+    return float(np.sum(x2 * (1.0 + 0.2 * x2) + 0.5 * np.sin(3.0 * x)))
 
 
 def main():
@@ -20,18 +21,19 @@ def main():
     output_filename = f"synthetic.dat"
     config_filename = "synthetic.cfg"
 
-    # --- Read delay configuration ---
+    # --- Read delay configuration (skipped entirely when RODOPT_NO_DELAY is set) ---
     delay = 0.0
-    try:
-        with open(config_filename, "r") as cfg:
-            line = cfg.readline().strip()
-            delay = float(line)
-    except FileNotFoundError:
-        print(f"Warning: {config_filename} not found → using delay = 0.0 s")
-    except ValueError:
-        print(f"Warning: Invalid delay value in {config_filename} → using delay = 0.0 s")
-    except Exception as e:
-        print(f"Warning: Could not read {config_filename}: {e}")
+    if not os.environ.get("RODOPT_NO_DELAY"):
+        try:
+            with open(config_filename, "r") as cfg:
+                line = cfg.readline().strip()
+                delay = float(line)
+        except FileNotFoundError:
+            print(f"Warning: {config_filename} not found → using delay = 0.0 s")
+        except ValueError:
+            print(f"Warning: Invalid delay value in {config_filename} → using delay = 0.0 s")
+        except Exception as e:
+            print(f"Warning: Could not read {config_filename}: {e}")
 
     # --- Read design vector ---
     try:
@@ -58,10 +60,12 @@ def main():
     # --- Write output safely ---
     tmp_file = output_filename + ".tmp"
     try:
-        with open(tmp_file, "w", encoding="utf-8") as f:
-            f.write(f"{fval:.12f}\n")
-            f.flush()
-            os.fsync(f.fileno())
+        # the rename alone keeps readers from seeing a partial file; no fsync needed
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, f"{fval:.12f}\n".encode("ascii"))
+        finally:
+            os.close(fd)
         os.replace(tmp_file, output_filename)
     except Exception as e:
         print(f"Error writing {output_filename}: {e}", file=sys.stderr)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache, partial
 from typing import Optional, Iterable, Sequence
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout,
@@ -9,6 +10,18 @@ from PyQt6.QtGui import QIcon
 import sys, os, re
 from xml.etree import ElementTree as ET
 
+# runs of non-alphanumerics (underscores included) become one "_" in XML tags
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Za-z]+")
+
+
+@lru_cache(maxsize=256)
+def _sanitize_tag(label: str) -> str:
+    """XML tag for a field label; labels are a small fixed set, so results are cached."""
+    s = _NON_ALNUM_RE.sub("_", label).strip("_")
+    if not s or s[0].isdigit():
+        s = "f_" + (s or "field")
+    return s
+
 
 class FilePathField(QWidget):
     """
@@ -22,6 +35,19 @@ class FilePathField(QWidget):
     """
     pathChanged = pyqtSignal(str)   # emits new text whenever any path changes
 
+    # browse icon, loaded on first use and shared by every instance
+    _folder_icon: Optional[QIcon] = None
+    _folder_icon_loaded = False
+
+    @classmethod
+    def _get_folder_icon(cls) -> Optional[QIcon]:
+        """The folder icon, or None if the image is missing."""
+        if not cls._folder_icon_loaded:
+            icon_path = os.path.join("images", "folder_open.svg")
+            cls._folder_icon = QIcon(icon_path) if os.path.exists(icon_path) else None
+            cls._folder_icon_loaded = True
+        return cls._folder_icon
+
     def __init__(
         self,
         name: str | Sequence[str],
@@ -53,7 +79,8 @@ class FilePathField(QWidget):
         self._fields: list[tuple[QLabel, QLineEdit, QPushButton]] = []
 
         # layout (no inline styling)
-        outer_layout = QVBoxLayout(self) if len(names) > 1 else QHBoxLayout(self)
+        # one row per name, stacked; a single field is just a one-row stack
+        outer_layout = QVBoxLayout(self)
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setSpacing(6)
 
@@ -92,9 +119,9 @@ class FilePathField(QWidget):
             # Keep button square-ish; let QSS padding round it off visually
             if button_size > 0:
                 btn.setFixedSize(QSize(button_size, button_size))
-            icon_path = os.path.join("images", "folder_open.svg")
-            if os.path.exists(icon_path):
-                btn.setIcon(QIcon(icon_path))
+            icon = self._get_folder_icon()
+            if icon is not None:
+                btn.setIcon(icon)
                 btn.setIconSize(QSize(max(1, button_size - 2), max(1, button_size - 2)))
             else:
                 btn.setText("...")
@@ -106,21 +133,16 @@ class FilePathField(QWidget):
 
             # store
             self._fields.append((label, edit, btn))
-            # vertical stack per field if multi, otherwise single row
-            if len(names) > 1:
-                row_wrap = QHBoxLayout()
-                row_wrap.setContentsMargins(0, 0, 0, 0)
-                row_wrap.setSpacing(0)
-                row_wrap.addLayout(row)
-                outer_layout.addLayout(row_wrap)
-            else:
-                outer_layout.addLayout(row)
+            outer_layout.addLayout(row)
 
             # signals
-            btn.clicked.connect(lambda _, e=edit, f=self._filters_per_field[idx]: self._browse(e, f))
+            btn.clicked.connect(partial(self._browse, edit, self._filters_per_field[idx]))
             # bubble the new text (matches DoE dirty tracking expectations)
             edit.textChanged.connect(self.pathChanged.emit)
 
+        # XML tag of each row; the labels never change after construction
+        self._field_tags: list[str] = [_sanitize_tag(lbl.text()) for lbl, _, _ in self._fields]
+
         self.setLayout(outer_layout)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
@@ -132,21 +154,16 @@ class FilePathField(QWidget):
     def from_xml(self, element: ET.Element) -> None:
         """Restore values from XML produced by to_xml()."""
         if len(self._fields) == 1:
-            lbl, edit, _ = self._fields[0]
-            tag = self._sanitize_tag(lbl.text())
-            child = element.find(tag)
+            edit = self._fields[0][1]
+            child = element.find(self._field_tags[0])
             if child is not None and child.text is not None:
                 edit.setText(child.text.strip())
         else:
-            paths: list[str] = []
-            for lbl, edit, _ in self._fields:
-                tag = self._sanitize_tag(lbl.text())
-                child = element.find(tag)
-                if child is not None and child.text is not None:
-                    paths.append(child.text.strip())
-                else:
-                    paths.append("")
-            self.set_paths(paths)
+            # one pass over the children; first occurrence wins, like element.find()
+            by_tag: dict[str, str] = {}
+            for child in element:
+                by_tag.setdefault(child.tag, child.text.strip() if child.text is not None else "")
+            self.set_paths([by_tag.get(tag, "") for tag in self._field_tags])
 
     # --- accessors ---
     @property
@@ -157,9 +174,21 @@ class FilePathField(QWidget):
     def paths(self) -> list[str]:
         return [edit.text() for _, edit, _ in self._fields]
 
-    def set_paths(self, paths: list[str]) -> None:
-        for (_, edit, _), p in zip(self._fields, paths, strict=False):
-            edit.setText(p)
+    def set_paths(self, paths: Sequence[str]) -> None:
+        # only iterated, never stored: callers may pass a shared tuple
+        # the edits still emit textChanged (per-row listeners see every row),
+        # but pathChanged fires once for the whole batch rather than per row
+        last: Optional[str] = None
+        blocked = self.blockSignals(True)
+        try:
+            for (_, edit, _), p in zip(self._fields, paths, strict=False):
+                if edit.text() != p:
+                    edit.setText(p)
+                    last = p
+        finally:
+            self.blockSignals(blocked)
+        if last is not None:
+            self.pathChanged.emit(last)
 
     # backwards-compat single-field accessors
     @property
@@ -177,7 +206,7 @@ class FilePathField(QWidget):
     # --- XML helpers ---
     def to_xml(self, root_tag: str | None = None, attr_label: str | None = None) -> ET.Element:
         if len(self._fields) == 1:
-            safe_tag = root_tag or self._sanitize_tag(self.name)
+            safe_tag = root_tag or self._field_tags[0]
             el = ET.Element(safe_tag)
             el.text = self.path
             if attr_label:
@@ -185,8 +214,8 @@ class FilePathField(QWidget):
             return el
         else:
             root = ET.Element(root_tag or "files")
-            for lbl, edit, _ in self._fields:
-                child = ET.Element(self._sanitize_tag(lbl.text()))
+            for (lbl, edit, _), tag in zip(self._fields, self._field_tags):
+                child = ET.Element(tag)
                 child.text = edit.text()
                 if attr_label:
                     child.set(attr_label, lbl.text())
@@ -195,19 +224,11 @@ class FilePathField(QWidget):
 
     def to_xml_string(self, **kwargs) -> str:
         el = self.to_xml(**kwargs)
-        return ET.tostring(el, encoding="utf-8").decode("utf-8")
-
-    @staticmethod
-    def _sanitize_tag(label: str) -> str:
-        s = re.sub(r"[^0-9A-Za-z]+", "_", label).strip("_")
-        s = re.sub(r"_+", "_", s)
-        if not s or s[0].isdigit():
-            s = "f_" + (s or "field")
-        return s
+        return ET.tostring(el, encoding="unicode")
 
     # --- browsing ---
     
-    def _browse(self, edit: QLineEdit, filters: str) -> None:
+    def _browse(self, edit: QLineEdit, filters: str, _checked: bool = False) -> None:
         from PyQt6.QtWidgets import QMessageBox
         from pathlib import Path
     
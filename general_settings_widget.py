@@ -17,6 +17,10 @@ from directory_path_field import DirectoryPathField
 from PyQt6.QtWidgets import QSpacerItem
 
 
+# problem names: letters, digits, underscore (also rejects any whitespace)
+_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
 class GeneralSettings(QWidget):
     """
     Composite widget for general study settings.
@@ -598,16 +602,11 @@ class GeneralSettings(QWidget):
           - must not contain ANY whitespace (spaces, tabs, etc.)
           - only letters, digits, underscore allowed
         """
-        import re
-
         # do NOT strip; we want to catch trailing/leading spaces as invalid
         name = text
 
-        # reject if any whitespace character present
-        if not name or any(ch.isspace() for ch in name):
-            is_valid = False
-        else:
-            is_valid = bool(re.fullmatch(r"[A-Za-z0-9_]+", name))
+        # fullmatch stops at the first bad character, whitespace included
+        is_valid = bool(name) and _NAME_RE.fullmatch(name) is not None
 
         self._set_problem_name_valid(is_valid)
 
@@ -1,6 +1,7 @@
 # objective_function_widget.py
 from __future__ import annotations
 from typing import Optional, Dict
+from contextlib import contextmanager
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
@@ -9,7 +10,7 @@ from PyQt6.QtWidgets import (
     QLabel
 )
 from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import pyqtSignal, Qt, QSize
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QSize, QTimer
 from xml.etree import ElementTree as ET
 import sys
 import os
@@ -23,6 +24,15 @@ from string_options_field import StringOptionsField
 from file_path_field import FilePathField
 from directory_path_field import DirectoryPathField
 from remote_server_widget import RemoteServerWidget
+from edit_style import (
+    INVALID_QSS, VALID_QSS, INACTIVE_QSS, set_edit_style, applied_edit_style
+)
+
+
+# validation patterns, compiled once (all used with fullmatch)
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_ALIAS_RE = re.compile(r"[A-Za-z0-9_]+")
+_FILENAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9 _.-]{0,198}[A-Za-z0-9]")
 
 
 class ObjectiveFunction(QWidget):
@@ -36,6 +46,16 @@ class ObjectiveFunction(QWidget):
 
     changed = pyqtSignal()
 
+    # default working directory, looked up on first construction and then shared
+    # (not at import time: main.py changes directory after importing the widgets)
+    _default_workdir_cache: Optional[str] = None
+
+    @classmethod
+    def refresh_default_workdir(cls) -> str:
+        """Re-read the current directory used as the default working directory."""
+        cls._default_workdir_cache = os.getcwd()
+        return cls._default_workdir_cache
+
     def __init__(
         self,
         *,
@@ -54,11 +74,25 @@ class ObjectiveFunction(QWidget):
 
         self._default_name = "ObjectiveFunction"
         self._default_execution_location = "local"
-        self._default_workdir = os.getcwd()
+        self._default_workdir = (
+            ObjectiveFunction._default_workdir_cache
+            or ObjectiveFunction.refresh_default_workdir()
+        )
+
+        # stripped path last checked by _validate_filename_field, per field
+        self._last_filename: dict[FilePathField, str] = {}
+        # ... and by _on_training_file_changed
+        self._last_training: Optional[str] = None
 
         self._num_params: int = 0
         self._param_names: list[str] = []
 
+        # bursts of edits collapse into one `changed` on the next event-loop pass
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.changed.emit)
+
         # ------------------------------------------------------------
         # Group box
         # ------------------------------------------------------------
@@ -82,17 +116,11 @@ class ObjectiveFunction(QWidget):
             field_width=field_width,
             parent=self.group_box,
         )
-        self.name_field.textChanged.connect(lambda _t: self.changed.emit())
+        # inner QLineEdit, looked up once instead of a findChild per keystroke
+        self._name_edit: QLineEdit | None = self.name_field.findChild(QLineEdit)
 
         self._name_valid = True
 
-        self._invalid_name_style = """
-        QLineEdit {
-            border: 2px solid red;
-            border-radius: 3px;
-        }
-        """
-
         # NEW: Alias field
         self.alias_field = StringField(
             "Alias",
@@ -104,9 +132,9 @@ class ObjectiveFunction(QWidget):
         self.alias_field.textChanged.connect(self._on_alias_changed)
 
         # NEW: tooltip ("balloon") for Alias field
-        alias_edit = self.alias_field.findChild(QLineEdit)
-        if alias_edit is not None:
-            alias_edit.setToolTip(
+        self._alias_edit: QLineEdit | None = self.alias_field.findChild(QLineEdit)
+        if self._alias_edit is not None:
+            self._alias_edit.setToolTip(
                 "Alias (optional): Delegate evaluation to another process.\n"
                 "Enter the name of an existing objective/constraint that will also compute "
                 "this objective's value.\n"
@@ -143,18 +171,12 @@ class ObjectiveFunction(QWidget):
         )
 
         # NEW: tooltip for Executable file name entry
-        if hasattr(self.exec_file, "_fields") and self.exec_file._fields:
-            _lbl, edit, _btn = self.exec_file._fields[0]
-            if isinstance(edit, QLineEdit):
-                edit.setToolTip(
-                    "Executable file used to evaluate this objective.\n"
-                    "Can be any runnable program (binary), a shell script (.sh), or a Python script (.py).\n"
-                    "It will be executed during runs to produce the objective output.\n"
-                    "Note: If an Alias is provided, this field is not used and becomes disabled."
-                )
-
-        # NEW: apply initial state (in case alias has a default)
-        self._sync_executable_with_alias()
+        self.exec_file._fields[0][1].setToolTip(
+            "Executable file used to evaluate this objective.\n"
+            "Can be any runnable program (binary), a shell script (.sh), or a Python script (.py).\n"
+            "It will be executed during runs to produce the objective output.\n"
+            "Note: If an Alias is provided, this field is not used and becomes disabled."
+        )
 
         self.grad_exec_file = FilePathField(
             "Gradient executable file name",
@@ -179,9 +201,7 @@ class ObjectiveFunction(QWidget):
         self.training_file.pathChanged.connect(self._on_training_file_changed)
 
         # NEW: add user hint in the entry field
-        if hasattr(self.training_file, "_fields") and self.training_file._fields:
-            _label, edit, _btn = self.training_file._fields[0]
-            edit.setPlaceholderText("Specify a CSV file (*.csv)")
+        self.training_file._fields[0][1].setPlaceholderText("Specify a CSV file (*.csv)")
 
         self.design_file = FilePathField(
             "Design variables file",
@@ -192,7 +212,18 @@ class ObjectiveFunction(QWidget):
             parent=self.group_box,
         )
         # NEW: validate filename
-        self.design_file.pathChanged.connect(lambda _p: self._validate_filename_field(self.design_file))
+        self.design_file.pathChanged.connect(self._validate_design_filename)
+
+        # (field, edit, button) rows that an alias disables, resolved once
+        _lbl, exec_edit, exec_btn = self.exec_file._fields[0]
+        _lbl, design_edit, design_btn = self.design_file._fields[0]
+        self._alias_toggled = (
+            (self.exec_file, exec_edit, exec_btn),
+            (self.design_file, design_edit, design_btn),
+        )
+
+        # NEW: apply initial state (in case alias has a default)
+        self._sync_executable_with_alias()
 
         self.output_file = FilePathField(
             "Output file",
@@ -203,7 +234,7 @@ class ObjectiveFunction(QWidget):
             parent=self.group_box,
         )
         # NEW: validate filename
-        self.output_file.pathChanged.connect(lambda _p: self._validate_filename_field(self.output_file))
+        self.output_file.pathChanged.connect(self._validate_output_filename)
 
         self.grad_output_file = FilePathField(
             "Gradient output file",
@@ -215,6 +246,19 @@ class ObjectiveFunction(QWidget):
         )
         self.grad_output_file.hide()
 
+        # line edit of every single-row file field, resolved once for the validators
+        self._file_edits: dict[FilePathField, QLineEdit] = {
+            f: f._fields[0][1]
+            for f in (
+                self.exec_file,
+                self.grad_exec_file,
+                self.training_file,
+                self.design_file,
+                self.output_file,
+                self.grad_output_file,
+            )
+        }
+
         self.working_dir_field = DirectoryPathField(
             "Working directory",
             path=self._default_workdir,
@@ -224,23 +268,18 @@ class ObjectiveFunction(QWidget):
         )
 
         # NEW: user hint for Working directory
-        if hasattr(self.working_dir_field, "_fields") and self.working_dir_field._fields:
-            _lbl, edit, _btn = self.working_dir_field._fields[0]
-            if isinstance(edit, QLineEdit):
-                edit.setToolTip(
-                    "Working directory used when evaluating this objective.\n"
-                    "All files required by the executable (scripts, input data, etc.) must be located in this directory."
-                )
+        self.working_dir_field._fields[0][1].setToolTip(
+            "Working directory used when evaluating this objective.\n"
+            "All files required by the executable (scripts, input data, etc.) must be located in this directory."
+        )
 
         # ------------------------------------------------------------
         # Remote server
         # ------------------------------------------------------------
-        self.remote_server_widget = RemoteServerWidget(
-            label_width=label_width,
-            field_width=field_width,
-            parent=self.group_box,
-        )
-        self.remote_server_widget.setVisible(False)
+        # built by _ensure_remote_widget once "remote" is first selected or loaded
+        self.remote_server_widget: Optional[RemoteServerWidget] = None
+        self._label_width = label_width
+        self._field_width = field_width
 
         # ------------------------------------------------------------
         # Clear button (icon-only)
@@ -271,9 +310,11 @@ class ObjectiveFunction(QWidget):
             self.output_file,
             self.grad_output_file,
             self.working_dir_field,
-            self.remote_server_widget,
         ):
             inner.addWidget(w)
+        # slot where the remote server widget is inserted on demand
+        self._inner_layout = inner
+        self._remote_index = inner.count()
 
         btn_row = QHBoxLayout()
         btn_row.addStretch(1)
@@ -329,14 +370,25 @@ class ObjectiveFunction(QWidget):
             self.grad_output_file,
             self.working_dir_field,
         ):
-            if hasattr(w, "pathChanged"):
-                w.pathChanged.connect(lambda _: self.changed.emit())
+            w.pathChanged.connect(self._schedule_changed)
 
-        self.remote_server_widget.changed.connect(self.changed.emit)
 
         # NEW: validate executable existence whenever path/location changes
-        self.exec_file.pathChanged.connect(lambda _p: self._validate_local_executable())
-        self.execution_location_field.valueChanged.connect(lambda _v: self._validate_local_executable())
+        self.exec_file.pathChanged.connect(self._validate_local_executable)
+        self.execution_location_field.valueChanged.connect(self._validate_local_executable)
+
+        # construction is not an edit
+        self._changed_timer.stop()
+
+    @pyqtSlot()
+    def _schedule_changed(self) -> None:
+        """Emit `changed` once on the next event-loop pass, however often called."""
+        # nobody listening yet (still being built or filled in): nothing to deliver
+        # later either, just as an immediate emit would have reached nobody
+        if not self.receivers(self.changed):
+            return
+        if not self._changed_timer.isActive():
+            self._changed_timer.start()
 
     # ==============================================================
     # Problem type integration
@@ -349,73 +401,130 @@ class ObjectiveFunction(QWidget):
         is_grad = value == "Gradient-enhanced"
         self.grad_exec_file.setVisible(is_grad)
         self.grad_output_file.setVisible(is_grad)
-        self.changed.emit()
+        self._schedule_changed()
 
     def _on_execution_location_changed(self, value: str) -> None:
-        self.remote_server_widget.setVisible(value.lower() == "remote")
-        self.changed.emit()
+        is_remote = value.lower() == "remote"
+        if is_remote:
+            self._ensure_remote_widget()
+        if self.remote_server_widget is not None:
+            self.remote_server_widget.setVisible(is_remote)
+        self._schedule_changed()
+
+    def _ensure_remote_widget(self) -> RemoteServerWidget:
+        """Build the remote-server block on first use; later calls return it."""
+        rs = self.remote_server_widget
+        if rs is None:
+            rs = RemoteServerWidget(
+                label_width=self._label_width,
+                field_width=self._field_width,
+                parent=self.group_box,
+            )
+            rs.setVisible(False)
+            self._inner_layout.insertWidget(self._remote_index, rs)
+            rs.changed.connect(self._schedule_changed)
+            self.remote_server_widget = rs
+        return rs
 
     # ==============================================================
     # Core behavior
     # ==============================================================
-    def clear_fields(self) -> None:
-        self.name_field.text = self._default_name
-        self.alias_field.text = ""  # NEW: clear alias field
-        self.execution_location_field.value = self._default_execution_location
-        self.derivative_info_field.value = self._default_derivative_info
-
-        for w in (
+    @contextmanager
+    def _bulk_update(self):
+        """
+        Hold back repaints and child-field signals while many fields are set,
+        then run every validator once and schedule a single `changed`
+        (from_xml cancels it again).
+        """
+        fields = (
+            self.name_field,
+            self.alias_field,
+            self.execution_location_field,
+            self.derivative_info_field,
             self.exec_file,
             self.grad_exec_file,
             self.training_file,
             self.design_file,
             self.output_file,
             self.grad_output_file,
-        ):
-            w.path = ""
-
-        self.working_dir_field.path = self._default_workdir
-        self.remote_server_widget.setVisible(False)
-        self.remote_server_widget.set_values(
-            hostname="", username="", port="22"
+            self.working_dir_field,
+            # and the file rows' own edits, so assigning a path relays nothing per row
+            *self._file_edits.values(),
         )
-        self.changed.emit()
+        self.group_box.setUpdatesEnabled(False)
+        was_blocked = [f.blockSignals(True) for f in fields]
+        try:
+            yield
+        finally:
+            for f, blocked in zip(fields, was_blocked):
+                f.blockSignals(blocked)
+            self._on_name_changed(self.name_field.text)
+            # keep the paths just assigned (shown in the disabled rows), as the
+            # baseline did by setting the alias before the paths
+            self._on_alias_changed(self.alias_field.text, clear=False)
+            self._on_execution_location_changed(self.execution_location_field.value)
+            self._on_derivative_info_changed(self.derivative_info_field.value)
+            self._on_training_file_changed(self.training_file.path)
+            self._validate_design_filename()
+            self._validate_output_filename()
+            self._validate_local_executable()
+            self.group_box.setUpdatesEnabled(True)
+
+    def clear_fields(self) -> None:
+        with self._bulk_update():
+            self.name_field.text = self._default_name
+            self.alias_field.text = ""  # NEW: clear alias field
+            self.execution_location_field.value = self._default_execution_location
+            self.derivative_info_field.value = self._default_derivative_info
+
+            for w in (
+                self.exec_file,
+                self.grad_exec_file,
+                self.training_file,
+                self.design_file,
+                self.output_file,
+                self.grad_output_file,
+            ):
+                w.path = ""
+
+            self.working_dir_field.path = self._default_workdir
+            if self.remote_server_widget is not None:
+                self.remote_server_widget.set_values(
+                    hostname="", username="", port="22"
+                )
 
     # --------------------------------------------------
     # Alias behavior: disables executable when alias is set
     # --------------------------------------------------
-    def _on_alias_changed(self, text: str) -> None:
+    def _on_alias_changed(self, text: str, *, clear: bool = True) -> None:
         """
         Alias rules:
           - empty is allowed
           - if non-empty: only letters/digits/underscore; no whitespace
         Invalid alias is shown with a red border.
+        `clear` is passed on to _sync_executable_with_alias.
         """
         alias = text  # do NOT strip; "abc " should be invalid
 
-        if not alias:
-            valid = True
-        elif any(ch.isspace() for ch in alias):
-            valid = False
-        else:
-            valid = bool(re.fullmatch(r"[A-Za-z0-9_]+", alias))
+        # the character class already rejects whitespace
+        valid = not alias or _ALIAS_RE.fullmatch(alias) is not None
 
         # apply red-border feedback to alias field's QLineEdit
-        edit = self.alias_field.findChild(QLineEdit)
+        edit = self._alias_edit
         if edit is not None:
             if valid:
-                edit.setStyleSheet("")
-                edit.setToolTip("")
+                set_edit_style(edit, VALID_QSS, "")
             else:
-                edit.setStyleSheet(self._invalid_name_style)
-                edit.setToolTip(
+                set_edit_style(
+                    edit,
+                    INVALID_QSS,
                     "Invalid alias. Use only letters, digits, and underscore; "
-                    "no spaces or special characters."
+                    "no spaces or special characters.",
                 )
 
         # Only disable/clear executable/design fields if alias is non-empty AND valid
         if valid and alias.strip():
-            self._sync_executable_with_alias()
+            self._sync_executable_with_alias(clear=clear)
         else:
             # if alias is empty OR invalid, ensure fields are enabled
             # (so user can still provide executable paths)
@@ -429,66 +538,60 @@ class ObjectiveFunction(QWidget):
 
             # force alias_active = False behavior by temporarily treating alias as empty
             # simplest: manually enable the fields here
-            inactive_style = "QLineEdit { background: #f0f0f0; color: #666; }"
-
-            def _enable_file_field(field) -> None:
-                if field is None or not hasattr(field, "_fields") or not field._fields:
-                    return
-                _lbl, e, b = field._fields[0]
+            for _field, e, b in self._alias_toggled:
                 e.setEnabled(True)
                 b.setEnabled(True)
                 # don't clobber red-border validation on other fields; only remove inactive gray
-                if e.styleSheet() == inactive_style:
-                    e.setStyleSheet("")
-
-            _enable_file_field(getattr(self, "exec_file", None))
-            _enable_file_field(getattr(self, "design_file", None))
+                if applied_edit_style(e) == INACTIVE_QSS:
+                    set_edit_style(e, VALID_QSS)
 
-        self.changed.emit()
+        self._schedule_changed()
 
-    def _sync_executable_with_alias(self) -> None:
+    def _sync_executable_with_alias(self, *, clear: bool = True) -> None:
         """
         If alias is non-empty:
           - clear and disable 'Executable file name'
-          - clear and disable 'Design variables file' (when available)
+          - clear and disable 'Design variables file'
         Else:
           - re-enable both
+        With clear=False the rows are only disabled and restyled, keeping their text.
         """
         alias_active = bool((self.alias_field.text or "").strip())
-        inactive_style = "QLineEdit { background: #f0f0f0; color: #666; }"
-
-        def _toggle_file_field(field, *, clear: bool) -> None:
-            if field is None or not hasattr(field, "_fields") or not field._fields:
-                return
-            _lbl, edit, btn = field._fields[0]
 
+        # Executable file and Design variables file
+        for field, edit, btn in self._alias_toggled:
             if alias_active:
                 # CHANGED: if inactive, it must be empty (always clear)
-                try:
-                    field.path = ""
-                except Exception:
-                    pass
-                edit.blockSignals(True)
-                edit.setText("")
-                edit.blockSignals(False)
+                if clear:
+                    try:
+                        field.path = ""
+                    except Exception:
+                        pass
+                    edit.blockSignals(True)
+                    edit.setText("")
+                    edit.blockSignals(False)
 
                 edit.setEnabled(False)
                 btn.setEnabled(False)
-                edit.setStyleSheet(inactive_style)
+                set_edit_style(edit, INACTIVE_QSS)
             else:
                 edit.setEnabled(True)
                 btn.setEnabled(True)
-                edit.setStyleSheet("")
-
-        # Executable file (always exists when this is called)
-        _toggle_file_field(getattr(self, "exec_file", None), clear=True)
-
-        # Design variables file (may not exist yet during __init__)
-        _toggle_file_field(getattr(self, "design_file", None), clear=True)
+                set_edit_style(edit, VALID_QSS)
+        # styles were replaced above; the next filename check must run in full
+        self._last_filename.clear()
 
     # --------------------------------------------------
     # Filename validation for design/output files
     # --------------------------------------------------
+    @pyqtSlot()
+    def _validate_design_filename(self) -> None:
+        self._validate_filename_field(self.design_file)
+
+    @pyqtSlot()
+    def _validate_output_filename(self) -> None:
+        self._validate_filename_field(self.output_file)
+
     def _validate_filename_field(self, field: "FilePathField") -> None:
         """
         Validate file name (basename) for Design variables file / Output file.
@@ -496,37 +599,34 @@ class ObjectiveFunction(QWidget):
         Regex:
           ^[A-Za-z0-9][A-Za-z0-9 _.-]{0,198}[A-Za-z0-9]$
         """
-        if field is None or not hasattr(field, "_fields") or not field._fields:
-            return
+        # underlying QLineEdit in FilePathField (always a QLineEdit, see __init__)
+        edit = self._file_edits[field]
 
-        # underlying QLineEdit in FilePathField
-        _lbl, edit, _btn = field._fields[0]
-        if not isinstance(edit, QLineEdit):
+        path = (field.path or "").strip()
+        # same text as the last check for this field: nothing to do
+        if self._last_filename.get(field) == path:
             return
+        self._last_filename[field] = path
 
-        path = (field.path or "").strip()
         # allow empty here (so user can decide), but mark invalid if non-empty and bad
         if not path:
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
             return
 
-        import os
         name = os.path.basename(path)
-
-        pattern = re.compile(r"^[A-Za-z0-9][A-Za-z0-9 _\.-]{0,198}[A-Za-z0-9]$")
-        ok = bool(pattern.fullmatch(name))
+        ok = _FILENAME_RE.fullmatch(name) is not None
 
         if ok:
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
         else:
-            edit.setStyleSheet(self._invalid_name_style)
-            edit.setToolTip(
+            set_edit_style(
+                edit,
+                INVALID_QSS,
                 "Invalid filename. Allowed: letters/digits; may include space, underscore, dot, hyphen; "
-                "must start and end with a letter/digit; length 2-200."
+                "must start and end with a letter/digit; length 2-200.",
             )
 
+    @pyqtSlot()
     def _validate_local_executable(self) -> None:
         """
         If execution location is local, executable must exist as a file.
@@ -538,38 +638,34 @@ class ObjectiveFunction(QWidget):
             is_local = True
 
         # underlying QLineEdit in FilePathField
-        edit = None
-        if hasattr(self.exec_file, "_fields") and self.exec_file._fields:
-            _lbl, e, _btn = self.exec_file._fields[0]
-            edit = e
-
-        if edit is None:
-            return
+        edit = self._file_edits[self.exec_file]
 
         if not is_local:
             # remote: do not require local executable existence
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
             return
 
         path = (self.exec_file.path or "").strip()
         ok = bool(path) and os.path.isfile(path)
 
         if ok:
-            edit.setStyleSheet("")
-            edit.setToolTip("")
+            set_edit_style(edit, VALID_QSS, "")
         else:
-            edit.setStyleSheet(self._invalid_name_style)
-            edit.setToolTip("Executable file not found. Please select an existing file for local execution.")
+            set_edit_style(
+                edit,
+                INVALID_QSS,
+                "Executable file not found. Please select an existing file for local execution.",
+            )
 
     # ==============================================================
     # Snapshot / XML
     # ==============================================================
     def snapshot(self) -> Dict[str, str | Dict[str, str]]:
+        location = self.execution_location_field.value
         data = {
             "name": self.name_field.text,
             "alias": self.alias_field.text,  # NEW
-            "execution_location": self.execution_location_field.value,
+            "execution_location": location,
             "executable_filename": self.exec_file.path,
             "training_data_filename": self.training_file.path,
             "design_vector_filename": self.design_file.path,
@@ -578,12 +674,13 @@ class ObjectiveFunction(QWidget):
         }
 
         if self._problem_type == "Optimization":
-            data["derivative_information"] = self.derivative_info_field.value
-            if self.derivative_info_field.value == "Gradient-enhanced":
+            derivative = self.derivative_info_field.value
+            data["derivative_information"] = derivative
+            if derivative == "Gradient-enhanced":
                 data["gradient_executable_filename"] = self.grad_exec_file.path
                 data["gradient_output_filename"] = self.grad_output_file.path
 
-        if self.execution_location_field.value == "remote":
+        if self.remote_server_widget is not None and location == "remote":
             data["remote_server"] = self.remote_server_widget.snapshot()
 
         return data
@@ -602,12 +699,14 @@ class ObjectiveFunction(QWidget):
         if alias or include_empty:
             add("alias", alias)
 
-        add("execution_location", self.execution_location_field.value)
+        location = self.execution_location_field.value
+        add("execution_location", location)
 
         if self._problem_type == "Optimization":
-            add("derivative_information", self.derivative_info_field.value)
+            derivative = self.derivative_info_field.value
+            add("derivative_information", derivative)
 
-            if self.derivative_info_field.value == "Gradient-enhanced":
+            if derivative == "Gradient-enhanced":
                 add("gradient_executable_filename", self.grad_exec_file.path)
                 add("gradient_output_filename", self.grad_output_file.path)
 
@@ -617,41 +716,46 @@ class ObjectiveFunction(QWidget):
         add("output_filename", self.output_file.path)
         add("working_directory", self.working_dir_field.path)
 
-        if self.execution_location_field.value == "remote":
+        if self.remote_server_widget is not None and location == "remote":
             root.append(self.remote_server_widget.to_xml("remote_server"))
 
         return root
 
     def from_xml(self, element: ET.Element) -> None:
+        # one pass over the children; first occurrence wins, like element.find()
+        by_tag: Dict[str, ET.Element] = {}
+        for child in element:
+            by_tag.setdefault(child.tag, child)
+
         def get(tag: str) -> str:
-            el = element.find(tag)
+            el = by_tag.get(tag)
             return el.text.strip() if el is not None and el.text else ""
 
-        self.name_field.text = get("name") or self._default_name
-        self.alias_field.text = get("alias")  # NEW
-        self.execution_location_field.value = (
-            get("execution_location") or self._default_execution_location
-        )
-
-        if (di := get("derivative_information")):
-            self.derivative_info_field.value = di
+        # validators and remote visibility run once when the block exits
+        with self._bulk_update():
+            self.name_field.text = get("name") or self._default_name
+            self.alias_field.text = get("alias")  # NEW
+            self.execution_location_field.value = (
+                get("execution_location") or self._default_execution_location
+            )
 
-        self.exec_file.path = get("executable_filename")
-        self.training_file.path = get("training_data_filename")
-        self.design_file.path = get("design_vector_filename")
-        self.output_file.path = get("output_filename")
-        self.grad_exec_file.path = get("gradient_executable_filename")
-        self.grad_output_file.path = get("gradient_output_filename")
-        self.working_dir_field.path = get("working_directory")
+            if (di := get("derivative_information")):
+                self.derivative_info_field.value = di
 
-        # NEW: refresh validation after loading values
-        self._validate_local_executable()
+            self.exec_file.path = get("executable_filename")
+            self.training_file.path = get("training_data_filename")
+            self.design_file.path = get("design_vector_filename")
+            self.output_file.path = get("output_filename")
+            self.grad_exec_file.path = get("gradient_executable_filename")
+            self.grad_output_file.path = get("gradient_output_filename")
+            self.working_dir_field.path = get("working_directory")
 
-        if element.find("remote_server") is not None:
-            self.remote_server_widget.from_xml(element.find("remote_server"))
-            self.remote_server_widget.setVisible(True)
+            rs_el = by_tag.get("remote_server")
+            if rs_el is not None:
+                self._ensure_remote_widget().from_xml(rs_el)
 
-        self._on_derivative_info_changed(self.derivative_info_field.value)
+        # loading is not an edit: only user changes should reach `changed` listeners
+        self._changed_timer.stop()
 
     def _resolve_training_csv_path(self) -> str:
         raw = (self.training_file.path or "").strip()
@@ -663,9 +767,7 @@ class ObjectiveFunction(QWidget):
             return os.path.abspath(raw)
 
         # filename only -> look in working directory
-        wd = ""
-        if hasattr(self, "working_dir_field"):
-            wd = (self.working_dir_field.path or "").strip()
+        wd = (self.working_dir_field.path or "").strip()
 
         return os.path.abspath(os.path.join(wd, raw)) if wd else os.path.abspath(raw)
 
@@ -693,7 +795,7 @@ class ObjectiveFunction(QWidget):
         n = len(param_names)
         obj_col = n  # objective column is right after parameters
 
-        obj_name = (self.name_field.text or "").strip() if hasattr(self, "name_field") else ""
+        obj_name = (self.name_field.text or "").strip()
         obj_name = obj_name or "Objective"
 
         header: list[str] = []
@@ -859,14 +961,14 @@ class ObjectiveFunction(QWidget):
 
     def _name_line_edit(self) -> QLineEdit | None:
         """
-        Safely obtain the internal QLineEdit of StringField.
+        The internal QLineEdit of StringField (resolved once in __init__).
         """
-        return self.name_field.findChild(QLineEdit)
+        return self._name_edit
 
     def _is_valid_name(self, text: str) -> bool:
         if not text:
             return False
-        return bool(re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", text))
+        return _NAME_RE.fullmatch(text) is not None
 
 
     def _on_name_changed(self, text: str) -> None:
@@ -875,17 +977,9 @@ class ObjectiveFunction(QWidget):
 
         edit = self._name_line_edit()
         if edit is not None:
-            if valid:
-                edit.setStyleSheet("")
-            else:
-                edit.setStyleSheet("""
-                    QLineEdit {
-                        border: 2px solid red;
-                        border-radius: 3px;
-                    }
-                """)
+            set_edit_style(edit, VALID_QSS if valid else INVALID_QSS)
 
-        self.changed.emit()
+        self._schedule_changed()
 
 
     def is_name_valid(self) -> bool:
@@ -897,6 +991,10 @@ class ObjectiveFunction(QWidget):
         Show red border if invalid.
         """
         raw = new_path.strip()
+        # same text as the last check: nothing to do
+        if raw == self._last_training:
+            return
+        self._last_training = raw
         filename = os.path.basename(raw)
 
         # normalize display to basename only
@@ -912,7 +1010,8 @@ class ObjectiveFunction(QWidget):
             )
             return
 
-        if filename.lower().endswith(".csv"):
+        # lower-case only the 4-char suffix, not the whole path
+        if filename[-4:].lower() == ".csv":
             self._set_filefield_valid(self.training_file, valid=True, tooltip="")
         else:
             self._set_filefield_valid(
@@ -929,19 +1028,8 @@ class ObjectiveFunction(QWidget):
         - red border on invalid
         - normal border on valid
         """
-        if not hasattr(field, "_fields") or not field._fields:
-            return
-
-        # assuming FilePathField internally stores tuples (label, edit, btn)
-        label, edit, btn = field._fields[0]
-
-        if valid:
-            edit.setStyleSheet("")  # reset to default
-        else:
-            edit.setStyleSheet(
-                "QLineEdit { border: 2px solid red; border-radius: 3px; }"
-            )
-        edit.setToolTip(tooltip)
+        edit = self._file_edits[field]
+        set_edit_style(edit, VALID_QSS if valid else INVALID_QSS, tooltip)
 
     def set_parameter_info(self, num_params: int, names: list[str]) -> None:
         self._num_params = int(num_params)
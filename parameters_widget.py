@@ -14,6 +14,10 @@ import sys
 import re
 
 
+# parameter names: letters, digits, underscore (also rejects any whitespace)
+_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
 # ---------- Flexible double spinbox ----------
 class FlexibleDoubleSpinBox(QDoubleSpinBox):
     def __init__(self, parent: Optional[QWidget] = None, min_decimals: int = 4):
@@ -309,10 +313,8 @@ class Parameters(QWidget):
         """
         name = text  # do NOT strip, so "x1 " stays invalid
 
-        if not name or any(ch.isspace() for ch in name):
-            is_valid = False
-        else:
-            is_valid = bool(re.fullmatch(r"[A-Za-z0-9_]+", name))
+        # fullmatch stops at the first bad character, whitespace included
+        is_valid = bool(name) and _NAME_RE.fullmatch(name) is not None
 
         editor = self.sender()
         if isinstance(editor, QLineEdit):
@@ -465,13 +467,9 @@ class Parameters(QWidget):
         return root
 
     def to_xml_string(self) -> str:
-        import xml.dom.minidom as minidom
         el = self.to_xml()
-        xml_bytes = ET.tostring(el, encoding="utf-8")
-        parsed = minidom.parseString(xml_bytes)
-        pretty = parsed.toprettyxml(indent="  ")
-        pretty_no_decl = "\n".join(line for line in pretty.splitlines() if not line.strip().startswith("<?xml"))
-        return pretty_no_decl.strip() + "\n"
+        ET.indent(el, space="  ")
+        return ET.tostring(el, encoding="unicode") + "\n"
 
     def from_xml(self, element: ET.Element) -> None:
         params: List[Dict[str, Any]] = []
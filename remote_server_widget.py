@@ -187,7 +187,7 @@ class RemoteServerWidget(QWidget):
 
     def to_xml_string(self, **kwargs) -> str:
         el = self.to_xml(**kwargs)
-        return ET.tostring(el, encoding="utf-8").decode("utf-8")
+        return ET.tostring(el, encoding="unicode")
 
     def from_xml(self, element: ET.Element) -> None:
         """
@@ -236,9 +236,12 @@ class RemoteServerWidget(QWidget):
             "workdir": self.workdir_field.text(),
         }
 
+        children = []
         for key, value in data.items():
-            el = ET.SubElement(root, key)
+            el = ET.Element(key)
             el.text = str(value)
+            children.append(el)
+        root.extend(children)
 
         return root
 
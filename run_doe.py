@@ -272,6 +272,12 @@ class RunDoE(QWidget):
         self._csv_timer.timeout.connect(self._update_csv_table)
         self._csv_timer.start()
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        # the CSV poll skips the table while hidden; refresh now rather than on the next tick
+        if self.start_time:
+            QTimer.singleShot(0, self._update_csv_table)
+
     # ==========================================================
     # === Process handling ===
     # ==========================================================
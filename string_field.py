@@ -7,6 +7,9 @@ import sys
 from xml.etree import ElementTree as ET
 import re
 
+# runs of non-alphanumerics (underscores included) become one "_" in XML tags
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Za-z]+")
+
 
 class StringField(QWidget):
     """
@@ -17,6 +20,7 @@ class StringField(QWidget):
       - to_xml_string(...)
     """
     textChanged = pyqtSignal(str)
+    editingFinished = pyqtSignal()
 
     def __init__(
         self,
@@ -52,6 +56,7 @@ class StringField(QWidget):
 
         # Signal
         self._edit.textChanged.connect(self.textChanged.emit)
+        self._edit.editingFinished.connect(self.editingFinished.emit)
 
         # Lock composite size
         self.setFixedSize(self.sizeHint())
@@ -107,7 +112,7 @@ class StringField(QWidget):
         Accepts same kwargs as `to_xml` (e.g., tag="name", attr_label="label").
         """
         el = self.to_xml(**kwargs)
-        return ET.tostring(el, encoding="utf-8").decode("utf-8")
+        return ET.tostring(el, encoding="unicode")
 
     @staticmethod
     def _sanitize_tag(label: str) -> str:
@@ -117,8 +122,7 @@ class StringField(QWidget):
         - collapse multiple '_'s
         - ensure it starts with a letter; prefix with 'f_' if needed
         """
-        s = re.sub(r"[^0-9A-Za-z]+", "_", label).strip("_")
-        s = re.sub(r"_+", "_", s)
+        s = _NON_ALNUM_RE.sub("_", label).strip("_")
         if not s or s[0].isdigit():
             s = "f_" + (s or "field")
         return s
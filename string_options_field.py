@@ -7,6 +7,9 @@ from xml.etree import ElementTree as ET
 import sys
 import re
 
+# runs of non-alphanumerics (underscores included) become one "_" in XML tags
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Za-z]+")
+
 
 class StringOptionsField(QWidget):
     """
@@ -109,7 +112,7 @@ class StringOptionsField(QWidget):
 
     def to_xml_string(self, **kwargs) -> str:
         el = self.to_xml(**kwargs)
-        return ET.tostring(el, encoding="utf-8").decode("utf-8")
+        return ET.tostring(el, encoding="unicode")
 
     # --- properties ---
     @property
@@ -183,8 +186,7 @@ class StringOptionsField(QWidget):
     # --- utils ---
     @staticmethod
     def _sanitize_tag(label: str) -> str:
-        s = re.sub(r"[^0-9A-Za-z]+", "_", label).strip("_")
-        s = re.sub(r"_+", "_", s)
+        s = _NON_ALNUM_RE.sub("_", label).strip("_")
         if not s or s[0].isdigit():
             s = "f_" + (s or "field")
         return s
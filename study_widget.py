@@ -9,7 +9,6 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QIcon
 from xml.etree import ElementTree as ET
-import xml.dom.minidom as minidom
 import sys
 import os
 
@@ -559,9 +558,10 @@ class Study(QWidget):
         return root
 
     def to_xml_string(self) -> str:
-        rough = ET.tostring(self.to_xml(), encoding="utf-8")
-        pretty = minidom.parseString(rough).toprettyxml(indent="  ", encoding="utf-8")
-        return pretty.decode("utf-8")
+        # indent the fresh tree in place instead of a minidom parse/pretty-print roundtrip
+        root = self.to_xml()
+        ET.indent(root, space="  ")
+        return '<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(root, encoding="unicode") + "\n"
 
 
 # ----------------------------------------------------------------------